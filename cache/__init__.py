@@ -1,4 +1,11 @@
 from .cache_manager import CacheManager, cache_manager
+from .callback_throttle import CallbackThrottle, toggle_throttle
+from .captcha_settings_cache import (
+    CaptchaSettingsCache,
+    CaptchaSettingsDTO,
+    captcha_settings_cache,
+)
+from .chat_admins_cache import ChatAdminsCache, chat_admins_cache
 from .redis_client import RedisClient, redis_client
 
 
@@ -7,4 +14,11 @@ __all__ = [
     "RedisClient",
     "cache_manager",
     "CacheManager",
+    "captcha_settings_cache",
+    "CaptchaSettingsCache",
+    "CaptchaSettingsDTO",
+    "toggle_throttle",
+    "CallbackThrottle",
+    "chat_admins_cache",
+    "ChatAdminsCache",
 ]
@@ -12,6 +12,10 @@ class CacheManager:
     def _get_user_key(user_id: int) -> str:
         return f"user:{user_id}"
 
+    @staticmethod
+    def _get_user_locale_key(user_id: int) -> str:
+        return f"locale:{user_id}"
+
     @staticmethod
     def _get_group_key(group_id: int) -> str:
         return f"group:{group_id}"
@@ -51,6 +55,26 @@ class CacheManager:
         key = self._get_user_key(user_id)
         return await redis_client.delete(key)
 
+    # User locale caching
+    async def get_user_locale(self, user_id: int) -> str | None:
+        """Get resolved user locale from cache"""
+        key = self._get_user_locale_key(user_id)
+        # Locale is stored as a plain string, skip the JSON decoding attempt
+        return await redis_client.get_raw(key)
+
+    async def set_user_locale(
+        self, user_id: int, locale: str, ttl: int | None = None
+    ) -> bool:
+        """Set resolved user locale in cache"""
+        key = self._get_user_locale_key(user_id)
+        cache_ttl = ttl or settings.locale_cache_ttl
+        return await redis_client.set(key, locale, cache_ttl)
+
+    async def delete_user_locale(self, user_id: int) -> bool:
+        """Delete user locale from cache"""
+        key = self._get_user_locale_key(user_id)
+        return await redis_client.delete(key)
+
     # Group caching
     async def get_group(self, group_id: int) -> dict[str, Any] | None:
         """Get group data from cache"""
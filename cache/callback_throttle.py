@@ -0,0 +1,32 @@
+import time
+from collections.abc import Hashable
+
+
+class CallbackThrottle:
+    """In-process debounce for repeated callback presses"""
+
+    def __init__(self, window: float = 0.3, maxsize: int = 10000):
+        self._window = window
+        self._maxsize = maxsize
+        self._seen: dict[Hashable, float] = {}
+
+    def seen(self, key: Hashable) -> bool:
+        """Return True if key was already seen within the window, else remember it"""
+        now = time.monotonic()
+        expires_at = self._seen.get(key)
+        if expires_at is not None and expires_at > now:
+            return True
+
+        if len(self._seen) >= self._maxsize:
+            # Drop expired entries; fall back to evicting the oldest one
+            self._seen = {k: v for k, v in self._seen.items() if v > now}
+            if len(self._seen) >= self._maxsize:
+                del self._seen[next(iter(self._seen))]
+
+        self._seen.pop(key, None)
+        self._seen[key] = now + self._window
+        return False
+
+
+# Global throttle for boolean toggle callbacks
+toggle_throttle = CallbackThrottle()
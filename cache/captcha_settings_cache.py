@@ -0,0 +1,98 @@
+import time
+from dataclasses import dataclass, fields, replace
+from typing import Any
+
+from database.models.captcha_setting import CaptchaSetting
+
+
+@dataclass(frozen=True, slots=True)
+class CaptchaSettingsDTO:
+    """Immutable snapshot of group CAPTCHA settings, detached from the ORM"""
+
+    id: int
+    group_id: int
+    captcha_type: str
+    captcha_size: int
+    difficulty_level: int
+    multicolor: bool
+    chars_mode: str
+    margin: bool
+    allow_multiplication: bool
+    timeout_seconds: int
+    auto_kick_on_fail: bool
+    max_attempts: int
+
+    @classmethod
+    def from_model(cls, captcha_settings: CaptchaSetting) -> "CaptchaSettingsDTO":
+        """Build snapshot from ORM row"""
+        return cls(
+            **{
+                field.name: getattr(captcha_settings, field.name)
+                for field in fields(cls)
+            }
+        )
+
+
+class CaptchaSettingsCache:
+    """In-process TTL cache for group CAPTCHA settings"""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: dict[int, tuple[float, CaptchaSettingsDTO]] = {}
+
+    def get(self, group_id: int) -> CaptchaSettingsDTO | None:
+        """Get CAPTCHA settings from cache if entry is not expired"""
+        entry = self._data.get(group_id)
+        if entry is None:
+            return None
+
+        expires_at, captcha_settings = entry
+        if expires_at < time.monotonic():
+            del self._data[group_id]
+            return None
+        return captcha_settings
+
+    def set(
+        self, group_id: int, captcha_settings: CaptchaSetting | CaptchaSettingsDTO
+    ) -> CaptchaSettingsDTO:
+        """Put CAPTCHA settings into cache and return the cached snapshot"""
+        if not isinstance(captcha_settings, CaptchaSettingsDTO):
+            captcha_settings = CaptchaSettingsDTO.from_model(captcha_settings)
+
+        self._data.pop(group_id, None)
+        if len(self._data) >= self._maxsize:
+            # Evict the oldest entry (dict keeps insertion order)
+            del self._data[next(iter(self._data))]
+        self._data[group_id] = (time.monotonic() + self._ttl, captcha_settings)
+        return captcha_settings
+
+    def update(self, group_id: int, **fields: Any) -> CaptchaSettingsDTO | None:
+        """Apply changed fields to cached settings instead of reloading them"""
+        entry = self._data.get(group_id)
+        if entry is None:
+            return None
+
+        expires_at, captcha_settings = entry
+        captcha_settings = replace(captcha_settings, **fields)
+        self._data[group_id] = (expires_at, captcha_settings)
+        return captcha_settings
+
+    def invalidate(self, group_id: int) -> None:
+        """Drop cached settings for group"""
+        self._data.pop(group_id, None)
+
+    async def get_or_load(self, group_id: int, uow) -> CaptchaSettingsDTO | None:
+        """Get CAPTCHA settings from cache or load them from database"""
+        captcha_settings = self.get(group_id)
+        if captcha_settings is not None:
+            return captcha_settings
+
+        captcha_settings = await uow.captcha_service.get_captcha_settings(group_id)
+        if captcha_settings is None:
+            return None
+        return self.set(group_id, captcha_settings)
+
+
+# Global CAPTCHA settings cache instance
+captcha_settings_cache = CaptchaSettingsCache()
@@ -0,0 +1,45 @@
+import asyncio
+import time
+from typing import Any
+
+from aiogram import Bot
+
+
+class ChatAdminsCache:
+    """Short-lived cache for get_chat + get_chat_administrators results"""
+
+    def __init__(self, ttl: float = 60.0, maxsize: int = 256):
+        self._ttl = ttl
+        self._maxsize = maxsize
+        # Keyed by the identifier passed to the Bot API (id or @username)
+        self._data: dict[int | str, tuple[float, Any, list]] = {}
+
+    async def get_chat_and_admins(self, bot: Bot, chat: int | str) -> tuple[Any, list]:
+        """Get chat info and its administrators, querying Telegram on cache miss"""
+        entry = self._data.get(chat)
+        if entry is not None:
+            expires_at, chat_info, admins = entry
+            if expires_at > time.monotonic():
+                return chat_info, admins
+            del self._data[chat]
+
+        # Both methods accept either id or @username, so request them together
+        chat_info, admins = await asyncio.gather(
+            bot.get_chat(chat), bot.get_chat_administrators(chat)
+        )
+
+        if len(self._data) >= self._maxsize:
+            # Evict the oldest entry (dict keeps insertion order)
+            del self._data[next(iter(self._data))]
+        self._data[chat] = (time.monotonic() + self._ttl, chat_info, admins)
+        return chat_info, admins
+
+    def invalidate(self, chat_id: int) -> None:
+        """Drop cached entries for chat, whichever identifier they were cached by"""
+        stale = [key for key, entry in self._data.items() if entry[1].id == chat_id]
+        for key in stale:
+            del self._data[key]
+
+
+# Global chat administrators cache instance
+chat_admins_cache = ChatAdminsCache()
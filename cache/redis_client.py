@@ -48,6 +48,13 @@ class RedisClient:
         except json.JSONDecodeError:
             return value
 
+    async def get_raw(self, key: str) -> str | None:
+        """Get plain string value from Redis without JSON decoding"""
+        if not self.redis:
+            return None
+
+        return await self.redis.get(key)
+
     async def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
         """Set value in Redis"""
         if not self.redis:
@@ -75,7 +75,7 @@ class Settings(BaseSettings):
         default=20, description="Размер пула соединений", env="DB_POOL_SIZE"
     )
     max_overflow: int = Field(
-        default=30,
+        default=10,
         description="Максимальное количество дополнительных соединений",
         env="DB_MAX_OVERFLOW",
     )
@@ -85,10 +85,15 @@ class Settings(BaseSettings):
         env="DB_POOL_TIMEOUT",
     )
     pool_recycle: int = Field(
-        default=3600,
+        default=1800,
         description="Время жизни соединения в секундах",
         env="DB_POOL_RECYCLE",
     )
+    pool_pre_ping: bool = Field(
+        default=True,
+        description="Проверять соединение перед выдачей из пула",
+        env="DB_POOL_PRE_PING",
+    )
 
     # Настройки производительности
     query_timeout: int = Field(
@@ -123,10 +128,15 @@ class Settings(BaseSettings):
     user_cache_ttl: int = Field(
         default=1800, description="TTL для кэша пользователей", env="USER_CACHE_TTL"
     )
+    locale_cache_ttl: int = Field(
+        default=60,
+        description="TTL для кэша языка пользователей",
+        env="LOCALE_CACHE_TTL",
+    )
 
     # Bot administration settings
-    bot_admin_ids: list[int] = Field(
-        default_factory=list, description="Список ID администраторов бота"
+    bot_admin_ids: set[int] = Field(
+        default_factory=set, description="Множество ID администраторов бота"
     )
 
     model_config = SettingsConfigDict(
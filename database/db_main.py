@@ -57,6 +57,7 @@ class Database:
                 max_overflow=settings.max_overflow,
                 pool_timeout=settings.pool_timeout,
                 pool_recycle=settings.pool_recycle,
+                pool_pre_ping=settings.pool_pre_ping,
                 # Дополнительные настройки для PostgreSQL
                 connect_args={
                     "command_timeout": settings.query_timeout,
@@ -170,6 +171,19 @@ class Database:
         await self.create_tables()
         logger.info("База данных полностью инициализирована")
     
+    def pool_status(self) -> dict[str, int]:
+        """Возвращает статистику пула соединений для мониторинга насыщения."""
+        if not self.engine:
+            raise RuntimeError("База данных не инициализирована")
+
+        pool = self.engine.pool
+        return {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+        }
+    
     @property
     def is_initialized(self) -> bool:
         """Проверяет, инициализирована ли база данных."""
@@ -0,0 +1,44 @@
+"""Make captcha_settings.group_id unique
+
+Revision ID: 3f9a1c7d2b84
+Revises: 6cb36cd9f53c
+Create Date: 2026-10-15 23:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f9a1c7d2b84'
+down_revision = '6cb36cd9f53c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Keep the oldest settings row per group: move sessions to it and
+    # drop the duplicates before adding the constraint
+    op.execute(
+        sa.text(
+            'UPDATE captcha_sessions s SET captcha_setting_id = keep.id '
+            'FROM captcha_settings cs, '
+            '(SELECT group_id, MIN(id) AS id FROM captcha_settings '
+            'GROUP BY group_id) keep '
+            'WHERE s.captcha_setting_id = cs.id '
+            'AND cs.group_id = keep.group_id AND cs.id <> keep.id'
+        )
+    )
+    op.execute(
+        sa.text(
+            'DELETE FROM captcha_settings a USING captcha_settings b '
+            'WHERE a.group_id = b.group_id AND a.id > b.id'
+        )
+    )
+    op.create_unique_constraint(
+        'uq_captcha_settings_group', 'captcha_settings', ['group_id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_captcha_settings_group', 'captcha_settings', type_='unique')
@@ -16,6 +16,16 @@ from sqlalchemy.sql import func
 from database import Base
 
 
+# Эмодзи статусов кампании для отображения в интерфейсе
+_CAMPAIGN_STATUS_EMOJI = {
+    "draft": "📝",
+    "active": "✅",
+    "paused": "⏸️",
+    "completed": "✔️",
+    "archived": "📦",
+}
+
+
 class AdCampaignStatus(enum.Enum):
     DRAFT = "draft"
     ACTIVE = "active"
@@ -23,6 +33,10 @@ class AdCampaignStatus(enum.Enum):
     COMPLETED = "completed"
     ARCHIVED = "archived"
 
+    def __init__(self, value: str):
+        # Эмодзи вычисляется один раз при создании члена перечисления
+        self.emoji = _CAMPAIGN_STATUS_EMOJI.get(value, "❓")
+
 
 class AdCreativeContentType(enum.Enum):
     TEXT = "text"
@@ -8,6 +8,7 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    UniqueConstraint,
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -18,6 +19,11 @@ from database import Base
 class CaptchaSetting(Base):
     __tablename__ = "captcha_settings"
 
+    # Одна запись настроек на группу
+    __table_args__ = (
+        UniqueConstraint("group_id", name="uq_captcha_settings_group"),
+    )
+
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     group_id = Column(BigInteger, ForeignKey("groups.id"), nullable=False)
 
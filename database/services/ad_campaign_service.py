@@ -1,5 +1,6 @@
 # database/services/ad_campaign_service.py
 
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import AdCampaign, CampaignStatus
@@ -57,6 +58,39 @@ class AdCampaignService:
         """Получение всех рекламных кампаний"""
         return await self.campaign_repo.get_all()
 
-    async def get_campaigns_by_advertiser(self, advertiser_id: int) -> list[AdCampaign]:
-        """Получение всех кампаний рекламодателя"""
-        return await self.campaign_repo.get_by_advertiser(advertiser_id)
+    async def get_campaigns_by_advertiser(
+        self, advertiser_id: int, limit: int | None = None, offset: int = 0
+    ) -> list[AdCampaign]:
+        """Получение кампаний рекламодателя (с LIMIT/OFFSET на стороне БД)"""
+        if limit is None and not offset:
+            return await self.campaign_repo.get_by_advertiser(advertiser_id)
+
+        query = (
+            select(AdCampaign)
+            .where(AdCampaign.advertiser_id == advertiser_id)
+            .order_by(AdCampaign.created_at.desc(), AdCampaign.id.desc())
+            .offset(offset)
+        )
+        if limit is not None:
+            query = query.limit(limit)
+
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def get_advertiser_campaign_stats(self, advertiser_id: int) -> dict:
+        """Агрегированная статистика кампаний рекламодателя одним запросом"""
+        query = select(
+            func.count(AdCampaign.id),
+            func.count(AdCampaign.id).filter(
+                AdCampaign.status == CampaignStatus.ACTIVE
+            ),
+            func.coalesce(func.sum(AdCampaign.spent_amount), 0),
+        ).where(AdCampaign.advertiser_id == advertiser_id)
+        result = await self.session.execute(query)
+        total, active, spent = result.one()
+
+        return {
+            "total_campaigns": total,
+            "active_campaigns": active,
+            "total_spent": spent,
+        }
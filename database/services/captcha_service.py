@@ -2,13 +2,29 @@
 
 from datetime import datetime
 
-from sqlalchemy import func
+from sqlalchemy import func, not_, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import CaptchaSession, CaptchaSetting
 from ..repository import CaptchaSessionRepository, CaptchaSettingRepository
 
 
+# Значения настроек каптчи по умолчанию для новой группы
+DEFAULT_CAPTCHA_SETTINGS = {
+    "captcha_type": "standard",
+    "captcha_size": 2,
+    "difficulty_level": 3,
+    "multicolor": False,
+    "chars_mode": "nums",
+    "margin": False,
+    "allow_multiplication": False,
+    "timeout_seconds": 300,
+    "auto_kick_on_fail": True,
+    "max_attempts": 3,
+}
+
+
 class CaptchaService:
     """Сервис для работы с настройками и сессиями каптчи"""
 
@@ -24,14 +40,17 @@ class CaptchaService:
     async def create_default_captcha_settings(self, group_id: int) -> CaptchaSetting:
         """Создание настроек каптчи по умолчанию для новой группы"""
         return await self.captcha_setting_repo.create(
-            group_id=group_id,
-            captcha_type="standard",
-            captcha_size=2,
-            difficulty_level=3,
-            timeout_seconds=300,
-            auto_kick_on_fail=True,
-            max_attempts=3,
+            group_id=group_id, **DEFAULT_CAPTCHA_SETTINGS
+        )
+
+    async def ensure_default_captcha_settings(self, group_id: int) -> None:
+        """Создание настроек каптчи по умолчанию одним INSERT, если их еще нет"""
+        stmt = (
+            insert(CaptchaSetting)
+            .values(group_id=group_id, **DEFAULT_CAPTCHA_SETTINGS)
+            .on_conflict_do_nothing(constraint="uq_captcha_settings_group")
         )
+        await self.session.execute(stmt)
 
     async def update_captcha_setting(
         self, group_id: int, setting_name: str, value
@@ -41,6 +60,25 @@ class CaptchaService:
             group_id, setting_name, value
         )
 
+    async def toggle_and_return(
+        self, group_id: int, setting_name: str
+    ) -> CaptchaSetting | None:
+        """Инвертирование булевой настройки каптчи одним UPDATE ... RETURNING"""
+        column = getattr(CaptchaSetting, setting_name)
+        stmt = (
+            update(CaptchaSetting)
+            .where(CaptchaSetting.group_id == group_id)
+            .values({column: not_(column)})
+            .returning(CaptchaSetting)
+            .execution_options(synchronize_session=False)
+        )
+        # populate_existing: объект уже может быть загружен в сессию
+        # (например, только что созданные дефолтные настройки)
+        result = await self.session.execute(
+            stmt, execution_options={"populate_existing": True}
+        )
+        return result.scalar_one_or_none()
+
     async def update_captcha_settings(
         self, group_id: int, settings_data: dict
     ) -> CaptchaSetting | None:
@@ -1,8 +1,10 @@
 # database/services/filter_service.py
 
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..models import FilterRule
+from ..models import FilterRule, Group
 from ..repository import FilterRuleRepository
 
 
@@ -17,6 +19,20 @@ class FilterService:
         """Получение фильтров по группе"""
         return await self.filter_repo.get_by_group_id(group_id)
 
+    async def get_group_filters_with_title(
+        self, group_id: int
+    ) -> tuple[FilterRule | None, str | None]:
+        """Получение фильтров группы вместе с названием группы одним запросом"""
+        stmt = (
+            select(FilterRule, Group.title)
+            .outerjoin(Group, Group.id == FilterRule.id)
+            .where(FilterRule.id == group_id)
+        )
+        row = (await self.session.execute(stmt)).first()
+        if row is None:
+            return None, None
+        return row[0], row[1]
+
     async def update_filter_by_name(
         self, group_id: int, filter_name: str, value
     ) -> bool:
@@ -28,3 +44,8 @@ class FilterService:
     async def create_default_filters(self, group_id: int) -> FilterRule:
         """Создание фильтров по умолчанию для новой группы"""
         return await self.filter_repo.create(id=group_id)
+
+    async def ensure_default_filters(self, group_id: int) -> None:
+        """Создание фильтров по умолчанию одним INSERT, если их еще нет"""
+        stmt = insert(FilterRule).values(id=group_id).on_conflict_do_nothing()
+        await self.session.execute(stmt)
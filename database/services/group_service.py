@@ -1,8 +1,10 @@
 # database/services/group_service.py
 
+from collections.abc import Iterable
 from datetime import datetime, timedelta
 
 from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import GroupMember, MemberStatus, UserStatus
@@ -18,9 +20,13 @@ class GroupService:
         self.user_repo = UserRepository(session)
         self.group_repo = GroupRepository(session)
 
-    async def get_all_groups(self) -> list:
-        """Получение всех групп"""
-        result = await self.session.execute(select(self.group_repo.model_class))
+    async def get_all_groups(self, limit: int | None = None, offset: int = 0) -> list:
+        """Получение групп (limit и offset задают страницу, по умолчанию — все)"""
+        model = self.group_repo.model_class
+        stmt = select(model).order_by(model.id).offset(offset)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        result = await self.session.execute(stmt)
         return result.scalars().all()
 
     async def create_or_update_group(self, telegram_group):
@@ -46,18 +52,42 @@ class GroupService:
     async def add_user_to_group(
         self, user_id: int, group_id: int, status: MemberStatus = MemberStatus.MEMBER
     ) -> GroupMember:
-        """Добавление пользователя в группу"""
-        existing = await self.group_member_repo.get_by_user_and_group(user_id, group_id)
-
-        if existing:
-            # Обновляем существующее членство
-            return await self.group_member_repo.update(
-                existing, status=status, joined_at=func.now(), left_at=None
-            )
-        # Создаем новое членство
-        return await self.group_member_repo.create(
+        """Добавление пользователя в группу (один upsert по user_id, group_id)"""
+        stmt = insert(GroupMember).values(
             user_id=user_id, group_id=group_id, status=status
         )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_user_group",
+            set_={"status": status, "joined_at": func.now(), "left_at": None},
+        ).returning(GroupMember)
+        result = await self.session.execute(
+            stmt, execution_options={"populate_existing": True}
+        )
+        return result.scalar_one()
+
+    async def bulk_add_members(
+        self,
+        group_id: int,
+        user_ids: Iterable[int],
+        status: MemberStatus = MemberStatus.MEMBER,
+        batch_size: int = 50,
+    ) -> None:
+        """Массовое добавление пользователей в группу (upsert по user_id, group_id)"""
+        rows = [
+            {"user_id": user_id, "group_id": group_id, "status": status}
+            for user_id in user_ids
+        ]
+        for start in range(0, len(rows), batch_size):
+            stmt = insert(GroupMember).values(rows[start : start + batch_size])
+            stmt = stmt.on_conflict_do_update(
+                constraint="uq_user_group",
+                set_={
+                    "status": stmt.excluded.status,
+                    "joined_at": func.now(),
+                    "left_at": None,
+                },
+            )
+            await self.session.execute(stmt)
 
     async def warn_user(self, user_id: int, group_id: int) -> bool:
         """Выдача предупреждения пользователю"""
@@ -1,6 +1,9 @@
 # database/services/user_service.py
 
-from sqlalchemy import func
+from collections.abc import Collection
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import User
@@ -28,6 +31,30 @@ class UserService:
             last_active_at=func.now(),
         )
 
+    async def bulk_upsert_users(
+        self, telegram_users: list, is_bot: bool = False, batch_size: int = 50
+    ) -> None:
+        """Массовое создание пользователей; существующие записи не изменяются"""
+        rows = [
+            {
+                "id": telegram_user.id,
+                "username": telegram_user.username,
+                "first_name": telegram_user.first_name,
+                "last_name": telegram_user.last_name,
+                "language_code": telegram_user.language_code,
+                "is_bot": is_bot,
+                "last_active_at": func.now(),
+            }
+            for telegram_user in telegram_users
+        ]
+        for start in range(0, len(rows), batch_size):
+            stmt = (
+                insert(User)
+                .values(rows[start : start + batch_size])
+                .on_conflict_do_nothing(index_elements=[User.id])
+            )
+            await self.session.execute(stmt)
+
     async def create_or_update_user(self, telegram_user, is_bot: bool = False) -> User:
         """Creates or updates a user from Telegram"""
 
@@ -62,6 +89,13 @@ class UserService:
         """Получение пользователя по ID"""
         return await self.user_repo.get_by_id(user_id)
 
+    async def get_existing_ids(self, ids: Collection[int]) -> set[int]:
+        """Получение множества ID пользователей, уже существующих в БД"""
+        if not ids:
+            return set()
+        result = await self.session.execute(select(User.id).where(User.id.in_(ids)))
+        return set(result.scalars().all())
+
     async def add_points(self, user_id: int, points: int) -> bool:
         """Добавление баллов пользователю"""
         user = await self.user_repo.get_by_id(user_id)
@@ -1,3 +1,4 @@
+import re
 from datetime import datetime, timedelta
 from decimal import Decimal
 
@@ -5,6 +6,7 @@ from aiogram import F, Router
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import CallbackQuery, Message
+from aiogram.utils.i18n import get_i18n
 from aiogram.utils.i18n import gettext as _
 from database.services.ad_analytics_service import AdAnalyticsService
 from database.services.ad_campaign_service import AdCampaignService
@@ -30,12 +32,31 @@ from keyboards.ads import (
     get_rejection_reason_keyboard,
     get_start_date_keyboard,
 )
-from keyboards.buttons import AdCallbackFactory
+from keyboards.buttons import AdCallbackFactory, translate
 from loguru import logger
+from sqlalchemy.exc import OperationalError
 
 
 router = Router()
 
+# Количество кампаний на одной странице списка рекламодателя
+CAMPAIGNS_PER_PAGE = 10
+
+# Формат бюджета: необязательный минус, до 7 цифр и до 2 знаков после точки/запятой
+_BUDGET_RE = re.compile(r"^-?\d{1,7}(?:[.,]\d{1,2})?$")
+
+
+# Временные ошибки (таймауты, разрыв соединения с БД) - логируем без трейсбэка
+_TRANSIENT_ERRORS = (TimeoutError, OperationalError)
+
+
+def _log_handler_error(handler: str, user_id: int, error: Exception) -> None:
+    """Логирование ошибки хендлера с контекстом пользователя"""
+    if isinstance(error, _TRANSIENT_ERRORS):
+        logger.warning(f"{handler}: transient error uid={user_id}: {error!r}")
+    else:
+        logger.opt(exception=error).error(f"{handler} failed uid={user_id}")
+
 
 # Хендлеры для обычных рекламодателей
 @router.callback_query(
@@ -79,7 +100,10 @@ async def my_campaigns(call: CallbackQuery, session):
         )
         return
 
-    campaigns = await campaign_service.get_campaigns_by_advertiser(advertiser.id)
+    # Берем на одну запись больше, чтобы понять, нужна ли кнопка "показать еще"
+    campaigns = await campaign_service.get_campaigns_by_advertiser(
+        advertiser.id, limit=CAMPAIGNS_PER_PAGE + 1
+    )
 
     if not campaigns:
         text = _("no-campaigns", company_name=advertiser.company_name)
@@ -90,18 +114,8 @@ async def my_campaigns(call: CallbackQuery, session):
     text_lines = [_("my-campaigns-header", company_name=advertiser.company_name)]
     text_lines.append("")
 
-    for i, campaign in enumerate(
-        campaigns[:10], 1
-    ):  # Ограничиваем до 10 кампаний на страницу
-        # Определяем эмодзи статуса
-        status_emoji = {
-            "draft": "📝",
-            "active": "✅",
-            "paused": "⏸️",
-            "completed": "✔️",
-            "archived": "📦",
-        }.get(campaign.status.value, "❓")
-
+    locale = get_i18n().current_locale
+    for i, campaign in enumerate(campaigns[:CAMPAIGNS_PER_PAGE], 1):
         # Вычисляем процент потраченного бюджета
         budget_percent = (
             (campaign.spent_amount / campaign.budget * 100)
@@ -113,8 +127,8 @@ async def my_campaigns(call: CallbackQuery, session):
             "campaign-info",
             number=i,
             name=campaign.name,
-            status_emoji=status_emoji,
-            status=_(f"status-{campaign.status.value}"),
+            status_emoji=campaign.status.emoji,
+            status=translate(f"status-{campaign.status.value}", locale),
             spent=campaign.spent_amount,
             budget=campaign.budget,
             percent=budget_percent,
@@ -125,7 +139,9 @@ async def my_campaigns(call: CallbackQuery, session):
 
     await call.message.edit_text(
         text,
-        reply_markup=get_my_campaigns_keyboard(campaigns),
+        reply_markup=get_my_campaigns_keyboard(
+            campaigns, has_more=len(campaigns) > CAMPAIGNS_PER_PAGE
+        ),
         parse_mode="HTML",
     )
 
@@ -159,19 +175,11 @@ async def campaign_details(
     stats = await analytics_service.get_campaign_stats(campaign.id)
 
     # Формируем детальную информацию
-    status_emoji = {
-        "draft": "📝",
-        "active": "✅",
-        "paused": "⏸️",
-        "completed": "✔️",
-        "archived": "📦",
-    }.get(campaign.status.value, "❓")
-
     text = _(
         "campaign-details",
         name=campaign.name,
-        status_emoji=status_emoji,
-        status=_(f"status-{campaign.status.value}"),
+        status_emoji=campaign.status.emoji,
+        status=translate(f"status-{campaign.status.value}"),
         budget=campaign.budget,
         spent=campaign.spent_amount,
         remaining=campaign.budget - campaign.spent_amount,
@@ -254,19 +262,21 @@ async def create_campaign_name(message: Message, state: FSMContext):
 @router.message(CreateCampaignStates.waiting_for_budget, AdvertiserFilter())
 async def create_campaign_budget(message: Message, state: FSMContext):
     """Обработка бюджета кампании"""
-    try:
-        budget = Decimal(message.text.strip().replace(",", "."))
+    # Отсекаем некорректный ввод регулярным выражением, без исключений
+    match = _BUDGET_RE.match(message.text.strip()) if message.text else None
+    if not match:
+        await message.answer(_("invalid-budget-format"))
+        return
 
-        if budget <= 0:
-            await message.answer(_("budget-must-be-positive"))
-            return
+    budget = Decimal(match.group(0).replace(",", "."))
 
-        if budget > 1000000:  # Максимальный бюджет 1 млн
-            await message.answer(_("budget-too-large"))
-            return
+    # Знак допускается форматом, чтобы отрицательный бюджет получил свое сообщение
+    if budget <= 0:
+        await message.answer(_("budget-must-be-positive"))
+        return
 
-    except (ValueError, TypeError):
-        await message.answer(_("invalid-budget-format"))
+    if budget > 1000000:  # Максимальный бюджет 1 млн
+        await message.answer(_("budget-too-large"))
         return
 
     # Сохраняем бюджет и переходим к дате начала
@@ -426,6 +436,7 @@ async def create_campaign_final(call: CallbackQuery, state: FSMContext, session)
         await call.message.edit_text(text, reply_markup=keyboard)
 
     except Exception as e:
+        _log_handler_error("create_campaign_final", call.from_user.id, e)
         await state.clear()
         await call.message.edit_text(
             _("campaign-creation-error"), reply_markup=get_advertiser_menu()
@@ -459,6 +470,26 @@ async def admin_ad_menu(call: CallbackQuery):
     await call.message.edit_text(text, reply_markup=get_admin_ad_menu())
 
 
+async def _show_moderation_queue(
+    call: CallbackQuery, session, notice: str | None = None
+) -> None:
+    """Показ очереди модерации, notice выводится над ней"""
+    creative_service = AdCreativeService(session)
+    pending_creatives = await creative_service.get_pending_moderation()
+
+    text = _("moderation-queue-header")
+    if notice:
+        text = f"{notice}\n\n{text}"
+
+    if not pending_creatives:
+        text += "\n\n" + _("no-creatives-pending")
+    else:
+        text += f"\n\n📊 Всего креативов на модерации: {len(pending_creatives)}"
+
+    keyboard = get_moderation_queue_keyboard(pending_creatives)
+    await call.message.edit_text(text, reply_markup=keyboard)
+
+
 @router.callback_query(
     AdCallbackFactory.filter(F.action == "moderate_ads"), AdminFilter()
 )
@@ -467,20 +498,10 @@ async def moderate_ads(call: CallbackQuery, session):
     await call.answer()
 
     try:
-        creative_service = AdCreativeService(session)
-        pending_creatives = await creative_service.get_pending_moderation()
-
-        text = _("moderation-queue-header")
-
-        if not pending_creatives:
-            text += "\n\n" + _("no-creatives-pending")
-        else:
-            text += f"\n\n📊 Всего креативов на модерации: {len(pending_creatives)}"
-
-        keyboard = get_moderation_queue_keyboard(pending_creatives)
-        await call.message.edit_text(text, reply_markup=keyboard)
+        await _show_moderation_queue(call, session)
 
     except Exception as e:
+        _log_handler_error("moderate_ads", call.from_user.id, e)
         await call.message.edit_text(
             _("moderation-error"), reply_markup=get_admin_ad_menu()
         )
@@ -534,6 +555,7 @@ async def moderate_creative(
         await call.message.edit_text(text, reply_markup=keyboard)
 
     except Exception as e:
+        _log_handler_error("moderate_creative", call.from_user.id, e)
         await call.message.edit_text(
             _("moderation-error"), reply_markup=get_moderation_queue_keyboard()
         )
@@ -557,19 +579,17 @@ async def approve_creative(
         )
 
         if creative:
-            await call.message.edit_text(
-                _("creative-approved-success"),
-                reply_markup=get_moderation_queue_keyboard(),
+            # Возвращаемся к очереди модерации одним редактированием сообщения
+            await _show_moderation_queue(
+                call, session, notice=_("creative-approved-success")
             )
-
-            # Возвращаемся к очереди модерации
-            await moderate_ads(call, session)
         else:
             await call.message.edit_text(
                 _("creative-not-found"), reply_markup=get_moderation_queue_keyboard()
             )
 
     except Exception as e:
+        _log_handler_error("approve_creative", call.from_user.id, e)
         await call.message.edit_text(
             _("moderation-error"), reply_markup=get_moderation_queue_keyboard()
         )
@@ -580,12 +600,13 @@ async def approve_creative(
 )
 async def reject_creative(call: CallbackQuery, callback_data: AdCallbackFactory):
     """Отклонение креатива - выбор причины"""
-    await call.answer()
+    # Текст с деталями креатива остается прежним, меняем только кнопки,
+    # а подсказку показываем во всплывающем уведомлении
+    await call.answer(_("select-rejection-reason"))
 
-    text = _("select-rejection-reason")
     keyboard = get_rejection_reason_keyboard(callback_data.item_id)
 
-    await call.message.edit_text(text, reply_markup=keyboard)
+    await call.message.edit_reply_markup(reply_markup=keyboard)
 
 
 @router.callback_query(
@@ -616,19 +637,17 @@ async def reject_creative_with_reason(
         )
 
         if creative:
-            await call.message.edit_text(
-                _("creative-rejected-success", reason=reason),
-                reply_markup=get_moderation_queue_keyboard(),
+            # Возвращаемся к очереди модерации одним редактированием сообщения
+            await _show_moderation_queue(
+                call, session, notice=_("creative-rejected-success", reason=reason)
             )
-
-            # Возвращаемся к очереди модерации
-            await moderate_ads(call, session)
         else:
             await call.message.edit_text(
                 _("creative-not-found"), reply_markup=get_moderation_queue_keyboard()
             )
 
     except Exception as e:
+        _log_handler_error("reject_creative_with_reason", call.from_user.id, e)
         await call.message.edit_text(
             _("moderation-error"), reply_markup=get_moderation_queue_keyboard()
         )
@@ -689,6 +708,7 @@ async def process_custom_rejection_reason(message: Message, state: FSMContext, s
             )
 
     except Exception as e:
+        _log_handler_error("process_custom_rejection_reason", message.from_user.id, e)
         await state.clear()
         await message.answer(
             _("moderation-error"), reply_markup=get_moderation_queue_keyboard()
@@ -735,7 +755,7 @@ async def all_campaigns(call: CallbackQuery, callback_data: AdCallbackFactory, s
         )
 
     except Exception as e:
-        logger.error(f"Error in all_campaigns: {e}")
+        _log_handler_error("all_campaigns", call.from_user.id, e)
         await call.answer(_("error-occurred"), show_alert=True)
         await call.message.edit_text(
             _("error-occurred"), reply_markup=get_admin_ad_menu()
@@ -765,19 +785,15 @@ async def view_advertiser_details(
 
         # Получаем статистику рекламодателя
         campaign_service = AdCampaignService(session)
-        campaigns = await campaign_service.get_campaigns_by_advertiser(advertiser.id)
-
-        total_campaigns = len(campaigns)
-        active_campaigns = len([c for c in campaigns if c.status == "active"])
-        total_spent = sum(c.spent_amount for c in campaigns)
+        stats = await campaign_service.get_advertiser_campaign_stats(advertiser.id)
 
         # Формируем детальную информацию
         text = _("advertiser_details").format(
             name=advertiser.name,
             balance=advertiser.balance,
-            total_campaigns=total_campaigns,
-            active_campaigns=active_campaigns,
-            total_spent=total_spent,
+            total_campaigns=stats["total_campaigns"],
+            active_campaigns=stats["active_campaigns"],
+            total_spent=stats["total_spent"],
             created_at=advertiser.created_at.strftime("%d.%m.%Y %H:%M"),
         )
 
@@ -787,7 +803,7 @@ async def view_advertiser_details(
         await call.message.edit_text(text, reply_markup=keyboard)
 
     except Exception as e:
-        logger.error(f"Error in view_advertiser_details: {e}")
+        _log_handler_error("view_advertiser_details", call.from_user.id, e)
         await call.answer(_("error-occurred"), show_alert=True)
         await call.message.edit_text(
             _("error-occurred"), reply_markup=get_admin_ad_menu()
@@ -842,7 +858,7 @@ async def advertiser_management(
         )
 
     except Exception as e:
-        logger.error(f"Error in advertiser_management: {e}")
+        _log_handler_error("advertiser_management", call.from_user.id, e)
         await call.answer(_("error-occurred"), show_alert=True)
         await call.message.edit_text(
             _("error-occurred"), reply_markup=get_admin_ad_menu()
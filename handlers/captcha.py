@@ -1,51 +1,134 @@
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+
 from aiogram import F, Router
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
-from aiogram.types import CallbackQuery, FSInputFile, Message
+from aiogram.types import BufferedInputFile, CallbackQuery, Message
 from aiogram.utils.i18n import gettext as _
+from cache import captcha_settings_cache, toggle_throttle
 from database.unit_of_work import UnitOfWork
 from keyboards.captcha import (
     CaptchaCallbackFactory,
     get_back_to_captcha_settings_keyboard,
-    get_captcha_chars_mode_keyboard,
-    get_captcha_difficulty_keyboard,
     get_captcha_settings_keyboard,
-    get_captcha_size_keyboard,
-    get_captcha_type_keyboard,
+    get_option_keyboard,
 )
 from keyboards.filters import FiltersCallbackFactory
+from loguru import logger
 from utilites.captcha_generator import CaptchaGenerators
+from utilities.settings_writer import captcha_settings_writer
 
 
 router = Router()
 
+# Ключи локализации для названий числовых настроек каптчи
+SETTING_LABEL_KEYS = {
+    "timeout_seconds": "captcha-timeout-seconds",
+    "max_attempts": "captcha-max-attempts",
+}
+
+# Ключи локализации подсказок для настроек с выбором значения из списка
+OPTION_PROMPT_KEYS = {
+    "captcha_type": "select-captcha-type",
+    "captcha_size": "select-captcha-size",
+    "difficulty_level": "select-captcha-difficulty",
+    "chars_mode": "select-captcha-chars-mode",
+}
+
+# Поля настроек, влияющие на внешний вид каптчи
+PREVIEW_FIELDS = (
+    "captcha_type",
+    "captcha_size",
+    "difficulty_level",
+    "chars_mode",
+    "multicolor",
+    "margin",
+    "allow_multiplication",
+)
+PREVIEW_CACHE_SIZE = 200
+
+# file_id уже загруженных в Telegram превью каптчи по хэшу настроек
+_preview_file_ids: dict[str, str] = {}
+
+
+# Рендеринг превью редок, больше двух процессов держать незачем
+CAPTCHA_RENDER_WORKERS = 2
+
+# Пул процессов для рендеринга каптчи, создается при запуске роутера
+_process_pool: ProcessPoolExecutor | None = None
+
+
+@router.startup()
+async def _start_process_pool():
+    global _process_pool
+    _process_pool = ProcessPoolExecutor(max_workers=CAPTCHA_RENDER_WORKERS)
+
+
+@router.shutdown()
+async def _stop_process_pool():
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+def _preview_key(captcha_settings) -> str:
+    """Стабильный ключ превью по полям, влияющим на рендеринг"""
+    values = tuple(getattr(captcha_settings, field, None) for field in PREVIEW_FIELDS)
+    return hashlib.blake2b(repr(values).encode(), digest_size=16).hexdigest()
+
+
+def _remember_preview(key: str, file_id: str) -> None:
+    """Сохранить file_id превью, вытесняя самую старую запись"""
+    if len(_preview_file_ids) >= PREVIEW_CACHE_SIZE:
+        del _preview_file_ids[next(iter(_preview_file_ids))]
+    _preview_file_ids[key] = file_id
+
 
 class CaptchaStates(StatesGroup):
     waiting_for_timeout = State()
     waiting_for_max_attempts = State()
 
 
+async def _get_or_create_settings(group_id: int, uow: UnitOfWork):
+    """Настройки каптчи из кэша или БД; если их нет, создаются дефолтные"""
+    captcha_settings = await captcha_settings_cache.get_or_load(group_id, uow)
+    if captcha_settings is not None:
+        return captcha_settings
+
+    async with uow:
+        # Если настроек нет, создаем их с дефолтными значениями. Параллельный
+        # запрос мог успеть создать их раньше - ON CONFLICT DO NOTHING
+        await uow.captcha_service.ensure_default_captcha_settings(group_id)
+        await uow.commit()
+        captcha_settings = await uow.captcha_service.get_captcha_settings(group_id)
+    return captcha_settings_cache.set(group_id, captcha_settings)
+
+
+async def _show_settings_menu(callback: CallbackQuery, captcha_settings) -> None:
+    """Показать меню настроек каптчи, отправляя в Telegram только изменившееся"""
+    text = _("captcha-settings-menu")
+    keyboard = get_captcha_settings_keyboard(captcha_settings)
+
+    if callback.message.text != text:
+        await callback.message.edit_text(text=text, reply_markup=keyboard)
+    elif callback.message.reply_markup != keyboard:
+        # Текст не меняется — обновляем только клавиатуру
+        await callback.message.edit_reply_markup(reply_markup=keyboard)
+
+
 @router.callback_query(FiltersCallbackFactory.filter(F.action == "captcha_settings"))
 async def captcha_settings(
     callback: CallbackQuery, callback_data: FiltersCallbackFactory, uow: UnitOfWork
 ):
     """Показать настройки каптчи для группы"""
     group_id = callback_data.group_id
+    # Сразу подтверждаем нажатие, чтобы у пользователя не висел индикатор загрузки
+    await callback.answer()
 
-    async with uow:
-        # Получаем настройки каптчи для группы
-        captcha_settings = await uow.captcha_service.get_captcha_settings(group_id)
-
-        if not captcha_settings:
-            # Если настроек нет, создаем их с дефолтными значениями
-            captcha_settings = (
-                await uow.captcha_service.create_default_captcha_settings(
-                    group_id=group_id
-                )
-            )
-            await uow.commit()
-        # for key, value in captcha_settings:
-        #     logger.debug(f"Key: {key} - Value: {value}")
+    # Получаем настройки каптчи для группы (из кэша или БД)
+    captcha_settings = await _get_or_create_settings(group_id, uow)
     # Создаем клавиатуру с настройками
     keyboard = get_captcha_settings_keyboard(captcha_settings)
 
@@ -55,8 +138,6 @@ async def captcha_settings(
         reply_markup=keyboard,
     )
 
-    await callback.answer()
-
 
 @router.callback_query(CaptchaCallbackFactory.filter(F.action == "update"))
 async def captcha_update_setting(
@@ -72,80 +153,72 @@ async def captcha_update_setting(
 
     # В зависимости от типа настройки показываем соответствующую клавиатуру
     if key in ["auto_kick_on_fail", "multicolor", "allow_multiplication", "margin"]:
-        # Для булевых значений сразу переключаем
-        current_value = int(current_value)
-        new_value = bool(not current_value)
+        # Повторные нажатия в пределах окна только подтверждаем, без запросов к БД
+        if toggle_throttle.seen((callback.from_user.id, group_id, key)):
+            await callback.answer()
+            return
+
+        # Подтверждаем нажатие заранее, переключение выполняется после ответа
+        await callback.answer(_("setting-updated"))
 
+        # Для булевых значений сразу переключаем одним запросом
         async with uow:
-            await uow.captcha_service.update_captcha_setting(
-                group_id=group_id, setting_name=key, value=new_value
+            toggled = await uow.captcha_service.toggle_and_return(
+                group_id=group_id, setting_name=key
             )
-            await uow.commit()
 
-            # Получаем обновленные настройки
-            captcha_settings = await uow.captcha_service.get_captcha_settings(group_id)
+        if toggled is None:
+            # Настроек еще нет — создаем дефолтные и переключаем уже их
+            await _get_or_create_settings(group_id, uow)
+            async with uow:
+                toggled = await uow.captcha_service.toggle_and_return(
+                    group_id=group_id, setting_name=key
+                )
+            if toggled is None:
+                logger.warning(f"Captcha settings for group {group_id} not found")
+                return
+
+        # В кэше могут быть еще не записанные изменения других полей,
+        # поэтому переносим в него только переключенное значение
+        captcha_settings = captcha_settings_cache.update(
+            group_id, **{key: getattr(toggled, key)}
+        )
+        if captcha_settings is None:
+            captcha_settings = captcha_settings_cache.set(group_id, toggled)
         # Обновляем клавиатуру
         keyboard = get_captcha_settings_keyboard(captcha_settings)
 
         await callback.message.edit_reply_markup(
             reply_markup=keyboard,
         )
-        await callback.answer(_("setting-updated"))
-
-    elif key == "captcha_type":
-        # Показываем клавиатуру выбора типа каптчи
-        keyboard = get_captcha_type_keyboard(group_id, current_value)
-
-        await callback.message.edit_text(
-            text=_("select-captcha-type"),
-            reply_markup=keyboard,
-        )
-        await callback.answer()
-
-    elif key == "captcha_size":
-        # Показываем клавиатуру выбора размера каптчи
-        keyboard = get_captcha_size_keyboard(group_id, current_value)
-
-        await callback.message.edit_text(
-            text=_("select-captcha-size"),
-            reply_markup=keyboard,
-        )
-        await callback.answer()
 
-    elif key == "difficulty_level":
-        # Показываем клавиатуру выбора сложности каптчи
-        keyboard = get_captcha_difficulty_keyboard(group_id, current_value)
-
-        await callback.message.edit_text(
-            text=_("select-captcha-difficulty"),
-            reply_markup=keyboard,
-        )
+    elif key in OPTION_PROMPT_KEYS:
+        # Показываем клавиатуру выбора значения настройки
         await callback.answer()
-    elif key == "chars_mode":
-        # Показываем клавиатуру выбора режима символов каптчи
-        keyboard = get_captcha_chars_mode_keyboard(group_id, current_value)
+        keyboard = get_option_keyboard(key, group_id, current_value)
 
         await callback.message.edit_text(
-            text=_("select-captcha-chars-mode"),
+            text=_(OPTION_PROMPT_KEYS[key]),
             reply_markup=keyboard,
         )
-        await callback.answer()
 
     elif key == "timeout_seconds":
+        await callback.answer()
         await state.set_state(CaptchaStates.waiting_for_timeout)
         keyboard = get_back_to_captcha_settings_keyboard(group_id)
         await callback.message.edit_text(
             text=_("enter-new-value").format(
-                setting=_(f"captcha-{key.replace('_', '-')}")
+                setting=_(SETTING_LABEL_KEYS[key])
             ),
             reply_markup=keyboard,
         )
     elif key == "max_attempts":
+        await callback.answer()
         await state.set_state(CaptchaStates.waiting_for_max_attempts)
         keyboard = get_back_to_captcha_settings_keyboard(group_id)
         await callback.message.edit_text(
             text=_("enter-new-value").format(
-                setting=_(f"captcha-{key.replace('_', '-')}")
+                setting=_(SETTING_LABEL_KEYS[key])
             ),
             reply_markup=keyboard,
         )
@@ -176,12 +249,10 @@ async def process_numeric_setting_input(
     else:
         return  # Should not happen
 
-    async with uow:
-        await uow.captcha_service.update_captcha_setting(
-            group_id=group_id, setting_name=key, value=new_value
-        )
-        await uow.commit()
-        captcha_settings = await uow.captcha_service.get_captcha_settings(group_id)
+    # Сразу обновляем кэш, запись в БД выполняется пакетно в фоне
+    await _get_or_create_settings(group_id, uow)
+    captcha_settings = captcha_settings_cache.update(group_id, **{key: new_value})
+    captcha_settings_writer.enqueue(group_id, key, new_value)
 
     await state.clear()
 
@@ -213,25 +284,16 @@ async def captcha_set_value(
             await callback.answer(_("invalid-numeric-value"), show_alert=True)
             return
 
-    async with uow:
-        # Обновляем настройку
-        await uow.captcha_service.update_captcha_setting(
-            group_id=group_id, setting_name=key, value=new_value
-        )
-        await uow.commit()
+    # Подтверждаем нажатие до обновления настроек и меню
+    await callback.answer(_("setting-updated"))
 
-        # Получаем обновленные настройки
-        captcha_settings = await uow.captcha_service.get_captcha_settings(group_id)
+    # Сразу обновляем кэш, запись в БД выполняется пакетно в фоне
+    await _get_or_create_settings(group_id, uow)
+    captcha_settings = captcha_settings_cache.update(group_id, **{key: new_value})
+    captcha_settings_writer.enqueue(group_id, key, new_value)
 
     # Возвращаемся к главному меню настроек каптчи
-    keyboard = get_captcha_settings_keyboard(captcha_settings)
-
-    await callback.message.edit_text(
-        text=_("captcha-settings-menu"),
-        reply_markup=keyboard,
-    )
-
-    await callback.answer(_("setting-updated"))
+    await _show_settings_menu(callback, captcha_settings)
 
 
 @router.callback_query(CaptchaCallbackFactory.filter(F.action == "preview"))
@@ -242,26 +304,34 @@ async def captcha_preview(
 ):
     """Просмотр текущей каптчи"""
     group_id = callback_data.group_id
+    # Рендеринг может занять время — подтверждаем нажатие сразу
+    await callback.answer()
 
-    async with uow:
-        captcha_settings = await uow.captcha_service.get_captcha_settings(group_id)
-    generator = CaptchaGenerators(captcha_settings)
-    captcha_photo_path = await generator.get_captcha()
+    captcha_settings = await _get_or_create_settings(group_id, uow)
+    keyboard = get_back_to_captcha_settings_keyboard(group_id)
 
-    if not captcha_photo_path:
-        await callback.answer(_("error-generating-captcha"), show_alert=True)
-        return
+    # Для уже показанных настроек переиспользуем загруженное в Telegram фото
+    preview_key = _preview_key(captcha_settings)
+    photo = _preview_file_ids.get(preview_key)
 
-    photo = FSInputFile(captcha_photo_path)
-    keyboard = get_back_to_captcha_settings_keyboard(group_id)
+    if photo is None:
+        # Рендерим каптчу в отдельном процессе, не блокируя event loop
+        generator = CaptchaGenerators(captcha_settings)
+        captcha_image = await generator.get_captcha(executor=_process_pool)
+
+        if not captcha_image:
+            await callback.message.answer(_("error-generating-captcha"))
+            return
+
+        photo = BufferedInputFile(captcha_image, filename="captcha.jpg")
 
-    await callback.message.answer_photo(
+    sent = await callback.message.answer_photo(
         photo=photo,
         caption=_("captcha-preview-caption"),
         reply_markup=keyboard,
     )
-
-    await callback.answer()
+    if sent.photo:
+        _remember_preview(preview_key, sent.photo[-1].file_id)
 
 
 @router.callback_query(CaptchaCallbackFactory.filter(F.action == "settings"))
@@ -271,14 +341,9 @@ async def captcha_back_to_settings(
     """Возврат к главному меню настроек каптчи"""
     group_id = callback_data.group_id
 
-    async with uow:
-        captcha_settings = await uow.captcha_service.get_captcha_settings(group_id)
-
-    keyboard = get_captcha_settings_keyboard(captcha_settings)
+    await callback.answer()
 
-    await callback.message.edit_text(
-        text=_("captcha-settings-menu"),
-        reply_markup=keyboard,
-    )
+    captcha_settings = await _get_or_create_settings(group_id, uow)
 
-    await callback.answer()
+    # Если сообщение уже показывает это меню, запросов к Telegram не будет
+    await _show_settings_menu(callback, captcha_settings)
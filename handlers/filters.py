@@ -6,6 +6,7 @@ from aiogram.utils.i18n import gettext as _
 from database.unit_of_work import UnitOfWork
 from keyboards.buttons import AdminCallbackFactory, get_main_menu_keyboard
 from keyboards.filters import (
+    FILTERS_GROUPS_LIST_LIMIT,
     FiltersCallbackFactory,
     get_back_to_filter_menu,
     get_filters_list_for_group,
@@ -16,6 +17,20 @@ from loguru import logger
 
 router = Router()
 
+# Ключи локализации для названий числовых фильтров
+FILTER_LABEL_KEYS = {
+    "max_message_length": "filter-max-message-length",
+    "bonus_per_user": "filter-bonus-per-user",
+    "bonus_checkpoint": "filter-bonus-checkpoint",
+}
+
+# Допустимые диапазоны числовых фильтров и ключ сообщения об ошибке
+FILTER_RANGES = {
+    "max_message_length": (10, 4000, "invalid-message-length-range"),
+    "bonus_per_user": (1, 100, "invalid-bonus-per-user-range"),
+    "bonus_checkpoint": (100, 10000, "invalid-bonus-checkpoint-range"),
+}
+
 
 class FilterStates(StatesGroup):
     """Состояния для FSM при работе с фильтрами"""
@@ -25,7 +40,8 @@ class FilterStates(StatesGroup):
 
 @router.callback_query(AdminCallbackFactory.filter(F.action == "filters_menu"))
 async def group_filters_menu(query: CallbackQuery, uow: UnitOfWork):
-    groups = await uow.group_service.get_all_groups()
+    await query.answer()
+    groups = await uow.group_service.get_all_groups(limit=FILTERS_GROUPS_LIST_LIMIT)
     await query.message.edit_text(
         _("select_group"), reply_markup=get_groups_list_for_filters(groups)
     )
@@ -36,22 +52,23 @@ async def filters_menu(
     callback: CallbackQuery, uow: UnitOfWork, callback_data: FiltersCallbackFactory
 ):
     group_id = callback_data.group_id
+    # Сразу подтверждаем нажатие, запросы к БД выполняются после ответа
+    await callback.answer()
 
-    # Получаем фильтры для группы
-    filters = await uow.filter_service.get_group_filters(group_id)
+    # Получаем фильтры вместе с названием группы одним запросом
+    filters, group_title = await uow.filter_service.get_group_filters_with_title(
+        group_id
+    )
 
     if not filters:
+        groups = await uow.group_service.get_all_groups(limit=FILTERS_GROUPS_LIST_LIMIT)
         await callback.message.answer(
             text=_("no-filters-found"),
-            reply_markup=get_groups_list_for_filters(
-                await uow.group_service.get_all_groups()
-            ),
+            reply_markup=get_groups_list_for_filters(groups),
         )
         return
 
-    # Получаем информацию о группе для заголовка
-    group = await uow.group_service.get_group_by_id(group_id)
-    group_name = group.title if group else _("unknown-group")
+    group_name = group_title or _("unknown-group")
 
     await callback.message.edit_text(
         text=_("filters-for-group").format(group_name=group_name),
@@ -69,16 +86,19 @@ async def filter_update_menu(
     group_id = callback_data.group_id
     filter_key = callback_data.key
     current_value = callback_data.value
+    await callback.answer()
+
     if isinstance(current_value, bool):
         new_value = bool(not current_value)
 
         # Обновляем фильтр
         await uow.filter_service.update_filter_by_name(group_id, filter_key, new_value)
 
-        # Получаем обновленные фильтры
-        filters = await uow.filter_service.get_group_filters(group_id)
-        group = await uow.group_service.get_group_by_id(group_id)
-        group_name = group.title if group else _("unknown-group")
+        # Получаем обновленные фильтры вместе с названием группы
+        filters, group_title = await uow.filter_service.get_group_filters_with_title(
+            group_id
+        )
+        group_name = group_title or _("unknown-group")
 
         await callback.message.edit_text(
             text=_("filter-updated-success").format(group_name=group_name),
@@ -86,12 +106,8 @@ async def filter_update_menu(
         )
     else:
         # Определяем тип фильтра для подсказки пользователю
-        filter_names = {
-            "max_message_length": _("filter-max-message-length"),
-            "bonus_per_user": _("filter-bonus-per-user"),
-            "bonus_checkpoint": _("filter-bonus-checkpoint"),
-        }
-        filter_display_name = filter_names.get(filter_key, filter_key)
+        label_key = FILTER_LABEL_KEYS.get(filter_key)
+        filter_display_name = _(label_key) if label_key else filter_key
         # Сохраняем данные в состоянии FSM
         await state.update_data(
             group_id=group_id, filter_key=filter_key, current_value=current_value
@@ -121,25 +137,11 @@ async def process_custom_value(message: Message, state: FSMContext, uow: UnitOfW
         new_value = int(message.text.strip())
 
         # Проверяем диапазон значений в зависимости от типа фильтра
-        valid_value = True
-        error_message = ""
-
-        if filter_key == "max_message_length":
-            if new_value < 10 or new_value > 4000:
-                valid_value = False
-                error_message = _("invalid-message-length-range")
-        elif filter_key == "bonus_per_user":
-            if new_value < 1 or new_value > 100:
-                valid_value = False
-                error_message = _("invalid-bonus-per-user-range")
-        elif filter_key == "bonus_checkpoint":  # noqa: SIM102
-            if new_value < 100 or new_value > 10000:
-                valid_value = False
-                error_message = _("invalid-bonus-checkpoint-range")
-
-        if not valid_value:
+        value_range = FILTER_RANGES.get(filter_key)
+
+        if value_range and not value_range[0] <= new_value <= value_range[1]:
             await message.answer(
-                text=error_message,
+                text=_(value_range[2]),
                 reply_markup=get_back_to_filter_menu(
                     group_id, filter_key, current_value
                 ),
@@ -150,10 +152,11 @@ async def process_custom_value(message: Message, state: FSMContext, uow: UnitOfW
         # Обновляем фильтр
         await uow.filter_service.update_filter_by_name(group_id, filter_key, new_value)
 
-        # Получаем обновленные фильтры и информацию о группе
-        filters = await uow.filter_service.get_group_filters(group_id)
-        group = await uow.group_service.get_group_by_id(group_id)
-        group_name = group.title if group else _("unknown-group")
+        # Получаем обновленные фильтры вместе с названием группы
+        filters, group_title = await uow.filter_service.get_group_filters_with_title(
+            group_id
+        )
+        group_name = group_title or _("unknown-group")
 
         # Отправляем сообщение об успешном обновлении
         await message.answer(
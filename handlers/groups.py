@@ -1,16 +1,21 @@
-import re
+import asyncio
+import time
 
 from aiogram import F, Router
+from aiogram.exceptions import TelegramForbiddenError
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import CallbackQuery, Message
 from aiogram.utils.i18n import gettext as _
+from cache import chat_admins_cache
 from config import Settings
 from database.models.user import MemberStatus
 from database.unit_of_work import UnitOfWork
 from keyboards.buttons import get_main_menu_keyboard
 from keyboards.group import (
+    GROUPS_LIST_LIMIT,
     GroupCallbackFactory,
+    clear_groups_list_keyboard_cache,
     get_group_management_keyboard,
     get_groups_list_keyboard,
 )
@@ -19,6 +24,41 @@ from loguru import logger
 
 router = Router()
 
+# Префикс ссылки на группу, заменяемый на "@"
+_TME_PREFIX = "https://t.me/"
+
+# Максимальная длина ввода группы: ссылка с username (до 32 символов) или ID
+MAX_GROUP_INPUT_LENGTH = 128
+
+# Через сколько секунд показывать промежуточный статус при добавлении группы
+PROGRESS_UPDATE_AFTER = 3.0
+
+# Классификация ошибок: сначала по типу исключения, затем по тексту
+_ADD_GROUP_ERROR_TYPES = {TelegramForbiddenError: "error-bot-not-member"}
+_ADD_GROUP_ERROR_TEXTS = (
+    ("chat not found", "error-chat-not-found"),
+    ("bot is not a member", "error-bot-not-member"),
+    ("not enough rights", "error-insufficient-rights"),
+    ("permission", "error-insufficient-rights"),
+)
+_REMOVE_GROUP_ERROR_TEXTS = (
+    ("not found", "error-group-not-found"),
+    ("permission", "error-insufficient-permissions"),
+    ("foreign key", "error-cannot-remove-related-data"),
+)
+
+
+def _classify_error(
+    error: Exception,
+    texts: tuple[tuple[str, str], ...],
+    types: dict[type[Exception], str] | None = None,
+) -> str | None:
+    """Возвращает ключ локализации для известной ошибки или None"""
+    if types and (key := types.get(type(error))):
+        return key
+    message = str(error).casefold()
+    return next((key for needle, key in texts if needle in message), None)
+
 
 class GroupStates(StatesGroup):
     waiting_for_group_id = State()
@@ -41,8 +81,8 @@ async def on_group_list_callback(
 
 async def show_user_groups(message: Message, uow: UnitOfWork):
     """Показывает список групп пользователя."""
-    async with uow:
-        groups = await uow.group_service.get_all_groups()
+    # Только чтение: транзакцию не открываем и не коммитим
+    groups = await uow.group_service.get_all_groups(limit=GROUPS_LIST_LIMIT)
 
     if not groups:
         await message.edit_text(
@@ -81,71 +121,73 @@ async def group_add_second(
     settings: Settings,
 ):
     """Обрабатывает ввод ID/ссылки/username, добавляет группу и админов."""
-    group_input = message.text.strip() if message.text else ""
-    if not re.match(r"^-\d+$|^https://t\.me/|^@", group_input):
+    # Отсекаем пустой и заведомо слишком длинный ввод до любой обработки
+    if not message.text or len(message.text) > MAX_GROUP_INPUT_LENGTH:
         await message.answer(_("invalid-group-format"))
         return
 
-    group_id_or_username = group_input
-    if group_input.startswith("https://t.me/"):
-        group_id_or_username = group_input.replace("https://t.me/", "@")
+    group_input = message.text.strip()
+    if group_input.startswith(_TME_PREFIX):
+        group_id_or_username = "@" + group_input.removeprefix(_TME_PREFIX)
+    elif group_input.startswith("@") or (
+        group_input.startswith("-") and group_input[1:].isdigit()
+    ):
+        group_id_or_username = group_input
+    else:
+        await message.answer(_("invalid-group-format"))
+        return
 
     # Отправляем сообщение о начале процесса
     processing_message = await message.answer(_("getting-group-info"))
+    started_at = time.monotonic()
 
     try:
-        logger.debug(f"Attempting to get chat info for '{group_id_or_username}'")
-        chat_info = await message.bot.get_chat(group_id_or_username)
-        logger.debug(f"Got chat info: id={chat_info.id}, title='{chat_info.title}'")
-
-        # Обновляем сообщение о статусе
-        await message.bot.edit_message_text(
-            _("getting-admins-list"),
-            message.chat.id,
-            processing_message.message_id,
+        logger.debug("Attempting to get chat info for '{}'", group_id_or_username)
+        # Информация о группе и администраторы (кэшируются на минуту, чтобы
+        # повторная отправка той же группы после ошибки не ходила в Telegram)
+        chat_info, admins_raw = await chat_admins_cache.get_chat_and_admins(
+            message.bot, group_id_or_username
         )
+        logger.debug("Got chat info: id={}, title='{}'", chat_info.id, chat_info.title)
 
-        # Получаем администраторов группы
-        admins_raw = await message.bot.get_chat_administrators(chat_info.id)
-        admins = [admin.user for admin in admins_raw if not admin.user.is_bot]
-        logger.debug(f"Found {len(admins)} non-bot administrators.")
+        # Администраторы группы без ботов
+        admins = tuple(admin.user for admin in admins_raw if not admin.user.is_bot)
+        admin_count = len(admins)
+        logger.debug("Found {} non-bot administrators.", admin_count)
 
-        # Обновляем сообщение о статусе
-        await message.bot.edit_message_text(
-            _("saving-to-database"),
-            message.chat.id,
-            processing_message.message_id,
-        )
+        # Промежуточный статус показываем только для действительно долгих операций
+        if time.monotonic() - started_at > PROGRESS_UPDATE_AFTER:
+            await processing_message.edit_text(_("saving-to-database"))
 
         async with uow:
             # Создаем или обновляем группу через сервис
             await uow.group_service.create_or_update_group(chat_info)
 
-            # Добавляем администраторов
-            admin_count = 0
-            for admin in admins:
-                # Создаем пользователя, если он не существует
-                existing = await uow.user_service.get_user_by_id(admin.id)
-                if not existing:
-                    await uow.user_service.create_user(admin)
-
-                # Добавляем пользователя в группу как администратора
-                await uow.group_service.add_user_to_group(
-                    user_id=admin.id, group_id=chat_info.id, status=MemberStatus.ADMIN
-                )
-                admin_count += 1
-                settings.bot_admin_ids.append(admin.id)
+            # Добавляем администраторов пакетно: новых пользователей и членство в группе
+            admin_ids = {admin.id for admin in admins}
+            existing_ids = await uow.user_service.get_existing_ids(admin_ids)
+            new_admins = [admin for admin in admins if admin.id not in existing_ids]
+            if new_admins:
+                await uow.user_service.bulk_upsert_users(new_admins)
+            await uow.group_service.bulk_add_members(
+                chat_info.id, admin_ids, MemberStatus.ADMIN
+            )
+
+            # Фильтры и настройки каптчи по умолчанию создаются в той же
+            # транзакции (ON CONFLICT DO NOTHING для уже существующих)
+            await uow.filter_service.ensure_default_filters(chat_info.id)
+            await uow.captcha_service.ensure_default_captcha_settings(chat_info.id)
 
             # Обновляем список администраторов
-            settings.bot_admin_ids = list(set(settings.bot_admin_ids))
+            settings.bot_admin_ids.update(admin_ids)
 
-            await uow.filter_service.create_default_filters(chat_info.id)
+            # Список групп для клавиатуры читаем в той же транзакции
+            groups = await uow.group_service.get_all_groups(limit=GROUPS_LIST_LIMIT)
 
             await uow.commit()
 
-        await state.clear()
-        # Удаляем сообщение о статусе
-        await message.bot.delete_message(message.chat.id, processing_message.message_id)
+        # Список групп изменился - старые клавиатуры больше не понадобятся
+        clear_groups_list_keyboard_cache()
 
         # Формируем подробное сообщение об успехе
         username = f"@{chat_info.username}" if chat_info.username else _("no-username")
@@ -155,9 +197,13 @@ async def group_add_second(
             username=username,
             admin_count=admin_count,
         )
-        groups = await uow.group_service.get_all_groups()
-        await message.answer(
-            success_message, reply_markup=get_groups_list_keyboard(groups)
+        # Заменяем сообщение о статусе итоговым сообщением одним запросом,
+        # параллельно сбрасывая состояние FSM - запросы независимы
+        await asyncio.gather(
+            processing_message.edit_text(
+                success_message, reply_markup=get_groups_list_keyboard(groups)
+            ),
+            state.clear(),
         )
         logger.info(
             f"Группа {chat_info.title} (ID: {chat_info.id}) успешно добавлена пользователем {message.from_user.id}"
@@ -166,17 +212,14 @@ async def group_add_second(
         # Удаляем сообщение о статусе, если оно существует
         await message.bot.delete_message(message.chat.id, processing_message.message_id)
 
-        logger.exception(
-            f"Ошибка при добавлении группы {group_id_or_username}", exc_info=e
+        logger.opt(exception=e).error(
+            "Ошибка при добавлении группы {}", group_id_or_username
         )
 
         # Добавляем более информативное сообщение в зависимости от типа ошибки
-        if "chat not found" in str(e).lower():
-            error_message = _("error-chat-not-found")
-        elif "bot is not a member" in str(e).lower():
-            error_message = _("error-bot-not-member")
-        elif "not enough rights" in str(e).lower() or "permission" in str(e).lower():
-            error_message = _("error-insufficient-rights")
+        error_key = _classify_error(e, _ADD_GROUP_ERROR_TEXTS, _ADD_GROUP_ERROR_TYPES)
+        if error_key:
+            error_message = _(error_key)
         else:
             error_message = _("error-adding-group").format(error=str(e))
 
@@ -198,3 +241,40 @@ async def on_remove_group_callback(
     group_id = callback_data.group_id
 
     try:
+        await remove_group_by_id(callback, group_id, uow)
+    except Exception as e:
+        logger.exception(f"Ошибка при удалении группы {group_id}", exc_info=e)
+
+        error_key = _classify_error(e, _REMOVE_GROUP_ERROR_TEXTS)
+        await callback.message.edit_text(
+            _(error_key or "error-removing-group"),
+            reply_markup=get_main_menu_keyboard(user_role="admin"),
+        )
+
+    await state.clear()
+
+
+async def remove_group_by_id(callback: CallbackQuery, group_id: int, uow: UnitOfWork):
+    """Удаляет группу и показывает обновленный список групп"""
+    async with uow:
+        group = await uow.group_service.get_group_by_id(group_id)
+        if not group:
+            await callback.message.edit_text(_("group-not-found"))
+            return
+
+        if not await uow.group_service.delete_group(group_id):
+            await callback.message.edit_text(_("failed-to-remove-group"))
+            return
+
+        # Список групп для клавиатуры читаем в той же транзакции
+        groups = await uow.group_service.get_all_groups(limit=GROUPS_LIST_LIMIT)
+
+        await uow.commit()
+
+    clear_groups_list_keyboard_cache()
+    await callback.message.edit_text(
+        _("group-removed-success"), reply_markup=get_groups_list_keyboard(groups)
+    )
+    logger.info(
+        f"Группа {group.title} (ID: {group_id}) удалена пользователем {callback.from_user.id}"
+    )
@@ -1,6 +1,7 @@
 from aiogram import F, Router
 from aiogram.types import CallbackQuery
 from aiogram.utils.i18n import gettext as _
+from cache import cache_manager
 from config.settings import Settings
 from database.unit_of_work import UnitOfWork
 from keyboards.buttons import (
@@ -53,6 +54,8 @@ async def on_language_select(
     user_id = callback.from_user.id
     async with uow:
         await uow.user_service.update_user(user_id, {"language_code": locale})
+    # Сбрасываем закэшированный язык, чтобы следующие апдейты брали новый
+    await cache_manager.delete_user_locale(user_id)
 
     # Обновляем текущий язык в I18n
     i18n.current_locale = locale
@@ -2,6 +2,7 @@ from aiogram import F, Router
 from aiogram.enums.chat_type import ChatType
 from aiogram.filters import IS_ADMIN, IS_MEMBER, IS_NOT_MEMBER, ChatMemberUpdatedFilter
 from aiogram.types import ChatMemberUpdated
+from cache import chat_admins_cache
 from config import Settings
 from database.models.user import MemberStatus
 from database.unit_of_work import UnitOfWork
@@ -23,9 +24,12 @@ async def member_to_admin(
     await uow.group_service.add_user_to_group(
         user_id=event.from_user.id, group_id=event.chat.id, status=MemberStatus.ADMIN
     )
-    settings.bot_admin_ids.append(event.from_user.id)
+    settings.bot_admin_ids.add(event.from_user.id)
+    chat_admins_cache.invalidate(event.chat.id)
     logger.debug(
-        f"Member {event.from_user.full_name} change in chat {event.chat.title} to admin"
+        "Member {} change in chat {} to admin",
+        event.from_user.full_name,
+        event.chat.title,
     )
 
 
@@ -40,9 +44,12 @@ async def admin_to_member(
     await uow.group_service.add_user_to_group(
         user_id=event.from_user.id, group_id=event.chat.id, status=MemberStatus.MEMBER
     )
-    settings.bot_admin_ids.remove(event.from_user.id)
+    settings.bot_admin_ids.discard(event.from_user.id)
+    chat_admins_cache.invalidate(event.chat.id)
     logger.debug(
-        f"Admin {event.from_user.full_name} change in chat {event.chat.title} to member"
+        "Admin {} change in chat {} to member",
+        event.from_user.full_name,
+        event.chat.title,
     )
 
 
@@ -59,7 +66,9 @@ async def member_left(
 
     if success:
         logger.debug(
-            f"Member {event.from_user.full_name} left chat {event.chat.title} and was processed"
+            "Member {} left chat {} and was processed",
+            event.from_user.full_name,
+            event.chat.title,
         )
     else:
         logger.warning(
@@ -79,5 +88,7 @@ async def member_updated(
         user_id=event.from_user.id, group_id=event.chat.id, status=MemberStatus.MEMBER
     )
     logger.debug(
-        f"Member {event.from_user.full_name} change in chat {event.chat.title} to admin"
+        "Member {} change in chat {} to admin",
+        event.from_user.full_name,
+        event.chat.title,
     )
@@ -1,3 +1,7 @@
+from functools import lru_cache
+
+from aiogram.utils.i18n import get_i18n
+
 from keyboards.buttons import (
     get_ad_menu,
     get_admin_back_to_menu,
@@ -39,4 +43,10 @@ def get_admin_main_menu():
 
 def get_admin_language_keyboard():
     """Создает клавиатуру для выбора языка для администратора"""
+    return _get_admin_language_keyboard(get_i18n().current_locale)
+
+
+@lru_cache(maxsize=16)
+def _get_admin_language_keyboard(_locale: str):
+    """Клавиатура выбора языка администратора (кэшируется по локали)"""
     return get_language_keyboard(get_admin_back_to_menu())
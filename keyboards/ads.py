@@ -1,38 +1,117 @@
+from functools import lru_cache
+from itertools import islice
+
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+from aiogram.utils.i18n import get_i18n
 from aiogram.utils.i18n import gettext as _
+from aiogram.utils.keyboard import InlineKeyboardBuilder
 
 from keyboards.buttons import (
     AdCallbackFactory,
+    cache_per_locale,
     get_admin_back_to_menu,
     get_user_back_to_menu,
+    pack_callback,
+    translate,
+)
+
+
+# Сколько кампаний/креативов показывать на одной странице списка
+PAGE_SIZE = 10
+
+# Готовые callback_data для действий без параметров (pack() выполняется один раз)
+_CB_MY_CAMPAIGNS = AdCallbackFactory(action="my_campaigns").pack()
+_CB_CREATE_CAMPAIGN = AdCallbackFactory(action="create_campaign").pack()
+_CB_BALANCE = AdCallbackFactory(action="balance").pack()
+_CB_ANALYTICS = AdCallbackFactory(action="analytics").pack()
+_CB_CAMPAIGNS_ANALYTICS = AdCallbackFactory(action="campaigns_analytics").pack()
+_CB_AD_MENU = AdCallbackFactory(action="ad_menu").pack()
+_CB_MODERATE_ADS_ADMIN = AdCallbackFactory(action="moderate_ads", role="admin").pack()
+_CB_ALL_CAMPAIGNS_ADMIN = AdCallbackFactory(action="all_campaigns", role="admin").pack()
+_CB_ADVERTISER_MANAGEMENT = AdCallbackFactory(
+    action="advertiser_management", role="admin"
+).pack()
+_CB_ANALYTICS_ADMIN = AdCallbackFactory(action="analytics_admin", role="admin").pack()
+_CB_ADMIN_AD_MENU = AdCallbackFactory(action="admin_ad_menu", role="admin").pack()
+
+# Эмодзи статусов кампаний для администратора
+# (для рекламодателя используется AdCampaignStatus.emoji)
+_ADMIN_CAMPAIGN_STATUS_EMOJI = {
+    "active": "🟢",
+    "paused": "⏸️",
+    "completed": "✅",
+    "draft": "📝",
+    "pending": "⏳",
+}
+# Кнопка смены статуса кампании: статус -> (ключ перевода, действие)
+_CAMPAIGN_STATUS_ACTIONS = {
+    "draft": ("activate-campaign", "activate_campaign"),
+    "active": ("pause-campaign", "pause_campaign"),
+    "paused": ("resume-campaign", "resume_campaign"),
+}
+# Причины отклонения креатива: (ключ перевода, значение extra в callback_data)
+_REJECT_REASONS = (
+    ("inappropriate-content", "inappropriate"),
+    ("misleading-info", "misleading"),
+    ("poor-quality", "quality"),
+    ("policy-violation", "policy"),
 )
+# Эмодзи баланса рекламодателя: индекс - есть ли положительный баланс
+_BALANCE_EMOJI = ("💸", "💰")
+
+
+@lru_cache(maxsize=16)
+def _get_back_to_ad_menu_button(locale: str) -> InlineKeyboardButton:
+    """Кнопка возврата в меню рекламы (одна на локаль, разделяется клавиатурами)"""
+    return InlineKeyboardButton(
+        text=translate("back-to-ad-menu", locale), callback_data=_CB_AD_MENU
+    )
+
+
+@lru_cache(maxsize=16)
+def _get_back_to_admin_menu_button(locale: str) -> InlineKeyboardButton:
+    """Кнопка возврата в админское меню рекламы (одна на локаль)"""
+    return InlineKeyboardButton(
+        text=translate("back-to-admin-menu", locale), callback_data=_CB_ADMIN_AD_MENU
+    )
+
+
+def _ellipsize(text: str, limit: int) -> str:
+    """Обрезает текст до limit символов, добавляя многоточие"""
+    return text if len(text) <= limit else text[:limit] + "..."
+
 
+def _name_or_unknown(item) -> str:
+    """Название связанного объекта (кампании, рекламодателя) или Unknown"""
+    return item.name if item else "Unknown"
 
+
+@cache_per_locale
 def get_advertiser_menu() -> InlineKeyboardMarkup:
     """Клавиатура меню рекламодателя"""
     keyboard = [
         [
             InlineKeyboardButton(
                 text=_("my-campaigns"),
-                callback_data=AdCallbackFactory(action="my_campaigns").pack(),
+                callback_data=_CB_MY_CAMPAIGNS,
             )
         ],
         [
             InlineKeyboardButton(
                 text=_("create-campaign"),
-                callback_data=AdCallbackFactory(action="create_campaign").pack(),
+                callback_data=_CB_CREATE_CAMPAIGN,
             )
         ],
         [
             InlineKeyboardButton(
                 text=_("my-balance"),
-                callback_data=AdCallbackFactory(action="balance").pack(),
+                callback_data=_CB_BALANCE,
             )
         ],
         [
             InlineKeyboardButton(
                 text=_("ad-analytics"),
-                callback_data=AdCallbackFactory(action="analytics").pack(),
+                callback_data=_CB_ANALYTICS,
             )
         ],
         [get_user_back_to_menu()],
@@ -46,40 +125,39 @@ def get_advertiser_details_keyboard(advertiser_id: int) -> InlineKeyboardMarkup:
         [
             InlineKeyboardButton(
                 text=_("edit_advertiser_balance"),
-                callback_data=AdCallbackFactory(
-                    action="edit_advertiser_balance",
-                    item_id=advertiser_id,
-                    role="admin"
-                ).pack()
+                callback_data=pack_callback(
+                    AdCallbackFactory,
+                    "edit_advertiser_balance",
+                    "admin",
+                    advertiser_id,
+                    None,
+                )
             )
         ],
         [
             InlineKeyboardButton(
                 text=_("view_advertiser_campaigns"),
-                callback_data=AdCallbackFactory(
-                    action="view_advertiser_campaigns",
-                    item_id=advertiser_id,
-                    role="admin"
-                ).pack()
+                callback_data=pack_callback(
+                    AdCallbackFactory,
+                    "view_advertiser_campaigns",
+                    "admin",
+                    advertiser_id,
+                    None,
+                )
             )
         ],
         [
             InlineKeyboardButton(
                 text=_("block_advertiser"),
-                callback_data=AdCallbackFactory(
-                    action="block_advertiser",
-                    item_id=advertiser_id,
-                    role="admin"
-                ).pack()
+                callback_data=pack_callback(
+                    AdCallbackFactory, "block_advertiser", "admin", advertiser_id, None
+                )
             )
         ],
         [
             InlineKeyboardButton(
                 text=_("back_to_advertisers"),
-                callback_data=AdCallbackFactory(
-                    action="advertiser_management",
-                    role="admin"
-                ).pack()
+                callback_data=_CB_ADVERTISER_MANAGEMENT
             )
         ]
     ]
@@ -87,177 +165,153 @@ def get_advertiser_details_keyboard(advertiser_id: int) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
 
+@cache_per_locale
 def get_no_campaigns_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура когда у рекламодателя нет кампаний"""
     keyboard = [
         [
             InlineKeyboardButton(
                 text=_("create-campaign"),
-                callback_data=AdCallbackFactory(action="create_campaign").pack(),
+                callback_data=_CB_CREATE_CAMPAIGN,
             )
         ],
         [
             InlineKeyboardButton(
                 text=_("back-to-ad-menu"),
-                callback_data=AdCallbackFactory(action="ad_menu").pack(),
+                callback_data=_CB_AD_MENU,
             )
         ],
     ]
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
 
-def get_my_campaigns_keyboard(campaigns=None, page=1) -> InlineKeyboardMarkup:
-    """Клавиатура для списка кампаний рекламодателя"""
-    keyboard = []
-    
-    # Добавляем кнопки для каждой кампании
-    if campaigns:
-        for campaign in campaigns[:10]:  # Ограничиваем до 10 кампаний на страницу
-            # Определяем эмодзи статуса
-            status_emoji = {
-                "draft": "📝",
-                "active": "✅",
-                "paused": "⏸️",
-                "completed": "✔️",
-                "archived": "📦",
-            }.get(campaign.status.value, "❓")
-            
-            keyboard.append(
-                [
-                    InlineKeyboardButton(
-                        text=f"{status_emoji} {campaign.name[:20]}{'...' if len(campaign.name) > 20 else ''}",
-                        callback_data=AdCallbackFactory(
-                            action="campaign_details", item_id=campaign.id
-                        ).pack(),
-                    )
-                ]
+def get_my_campaigns_keyboard(
+    campaigns=None, page=1, has_more: bool | None = None
+) -> InlineKeyboardMarkup:
+    """Клавиатура для списка кампаний рекламодателя
+
+    Args:
+        campaigns: Кампании текущей страницы (лишние сверх PAGE_SIZE не показываются)
+        page: Номер текущей страницы
+        has_more: Есть ли следующая страница; если не передан, определяется
+            по количеству переданных кампаний
+    """
+    locale = get_i18n().current_locale
+    if has_more is None:
+        has_more = campaigns is not None and len(campaigns) > PAGE_SIZE
+
+    # Добавляем кнопки для каждой кампании (не больше PAGE_SIZE на страницу)
+    keyboard = [
+        [
+            InlineKeyboardButton(
+                text=(
+                    f"{campaign.status.emoji} "
+                    f"{_ellipsize(campaign.name, 20)}"
+                ),
+                callback_data=pack_callback(
+                    AdCallbackFactory,
+                    "campaign_details",
+                    "advertiser",
+                    campaign.id,
+                    None,
+                ),
             )
+        ]
+        for campaign in islice(campaigns or (), PAGE_SIZE)
+    ]
     
     # Добавляем кнопки управления
     control_buttons = [
         InlineKeyboardButton(
-            text=_("create-campaign"),
-            callback_data=AdCallbackFactory(action="create_campaign").pack(),
+            text=translate("create-campaign", locale),
+            callback_data=_CB_CREATE_CAMPAIGN,
         ),
         InlineKeyboardButton(
-            text=_("campaign-analytics"),
-            callback_data=AdCallbackFactory(action="campaigns_analytics").pack(),
+            text=translate("campaign-analytics", locale),
+            callback_data=_CB_CAMPAIGNS_ANALYTICS,
         ),
     ]
     keyboard.append(control_buttons)
     
-    # Если кампаний больше 10, добавляем пагинацию
-    if campaigns and len(campaigns) > 10:
+    # Если кампаний больше, чем помещается на страницу, добавляем пагинацию
+    if has_more:
         pagination_buttons = [
             InlineKeyboardButton(
-                text=_("show-more-campaigns"),
-                callback_data=AdCallbackFactory(
-                    action="campaigns_page",
-                    item_id=page + 1,
-                ).pack(),
+                text=translate("show-more-campaigns", locale),
+                callback_data=pack_callback(
+                    AdCallbackFactory, "campaigns_page", "advertiser", page + 1, None
+                ),
             )
         ]
         keyboard.append(pagination_buttons)
     
     # Кнопка возврата
-    keyboard.append(
-        [
-            InlineKeyboardButton(
-                text=_("back-to-ad-menu"),
-                callback_data=AdCallbackFactory(action="ad_menu").pack(),
-            )
-        ]
-    )
+    keyboard.append([_get_back_to_ad_menu_button(locale)])
     
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
 
 def get_campaign_details_keyboard(campaign) -> InlineKeyboardMarkup:
     """Клавиатура для детальной информации о кампании"""
-    keyboard = []
-    
-    # Кнопки в зависимости от статуса
-    if campaign.status.value == "draft":
-        keyboard.append(
-            [
-                InlineKeyboardButton(
-                    text=_("activate-campaign"),
-                    callback_data=AdCallbackFactory(
-                        action="activate_campaign", item_id=campaign.id
-                    ).pack(),
-                )
-            ]
+    builder = InlineKeyboardBuilder()
+
+    # Кнопка смены статуса, если она предусмотрена для текущего статуса
+    status_action = _CAMPAIGN_STATUS_ACTIONS.get(campaign.status.value)
+    if status_action:
+        label, action = status_action
+        builder.row(
+            InlineKeyboardButton(
+                text=_(label),
+                callback_data=pack_callback(
+                    AdCallbackFactory, action, "advertiser", campaign.id, None
+                ),
+            )
         )
-    elif campaign.status.value == "active":
-        keyboard.append(
-            [
-                InlineKeyboardButton(
-                    text=_("pause-campaign"),
-                    callback_data=AdCallbackFactory(
-                        action="pause_campaign", item_id=campaign.id
-                    ).pack(),
-                )
-            ]
+
+    # Общие кнопки управления: две в ряд, затем по одной
+    builder.row(
+        InlineKeyboardButton(
+            text=_("edit-campaign"),
+            callback_data=pack_callback(
+                AdCallbackFactory, "edit_campaign", "advertiser", campaign.id, None
+            ),
+        ),
+        InlineKeyboardButton(
+            text=_("campaign-creatives"),
+            callback_data=pack_callback(
+                AdCallbackFactory, "campaign_creatives", "advertiser", campaign.id, None
+            ),
+        ),
+    )
+    builder.row(
+        InlineKeyboardButton(
+            text=_("campaign-analytics"),
+            callback_data=pack_callback(
+                AdCallbackFactory, "campaign_analytics", "advertiser", campaign.id, None
+            ),
         )
-    elif campaign.status.value == "paused":
-        keyboard.append(
-            [
-                InlineKeyboardButton(
-                    text=_("resume-campaign"),
-                    callback_data=AdCallbackFactory(
-                        action="resume_campaign", item_id=campaign.id
-                    ).pack(),
-                )
-            ]
+    )
+    builder.row(
+        InlineKeyboardButton(
+            text=_("back-to-campaigns"), callback_data=_CB_MY_CAMPAIGNS
         )
-    
-    # Общие кнопки управления
-    keyboard.extend(
-        [
-            [
-                InlineKeyboardButton(
-                    text=_("edit-campaign"),
-                    callback_data=AdCallbackFactory(
-                        action="edit_campaign", item_id=campaign.id
-                    ).pack(),
-                ),
-                InlineKeyboardButton(
-                    text=_("campaign-creatives"),
-                    callback_data=AdCallbackFactory(
-                        action="campaign_creatives", item_id=campaign.id
-                    ).pack(),
-                ),
-            ],
-            [
-                InlineKeyboardButton(
-                    text=_("campaign-analytics"),
-                    callback_data=AdCallbackFactory(
-                        action="campaign_analytics", item_id=campaign.id
-                    ).pack(),
-                )
-            ],
-            [
-                InlineKeyboardButton(
-                    text=_("back-to-campaigns"),
-                    callback_data=AdCallbackFactory(action="my_campaigns").pack(),
-                )
-            ],
-        ]
     )
-    
-    return InlineKeyboardMarkup(inline_keyboard=keyboard)
+
+    return builder.as_markup()
 
 
+@cache_per_locale
 def get_create_campaign_cancel_keyboard():
     """Клавиатура с кнопкой отмены для создания кампании"""
     return InlineKeyboardMarkup(inline_keyboard=[
         [InlineKeyboardButton(
             text=_("cancel"),
-            callback_data=AdCallbackFactory(action="ad_menu").pack()
+            callback_data=_CB_AD_MENU
         )]
     ])
 
 
+@cache_per_locale
 def get_start_date_keyboard():
     """Клавиатура для выбора даты начала кампании"""
     return InlineKeyboardMarkup(inline_keyboard=[
@@ -267,11 +321,12 @@ def get_start_date_keyboard():
         )],
         [InlineKeyboardButton(
             text=_("cancel"),
-            callback_data=AdCallbackFactory(action="ad_menu").pack()
+            callback_data=_CB_AD_MENU
         )]
     ])
 
 
+@cache_per_locale
 def get_end_date_keyboard():
     """Клавиатура для выбора даты окончания кампании"""
     return InlineKeyboardMarkup(inline_keyboard=[
@@ -285,11 +340,12 @@ def get_end_date_keyboard():
         )],
         [InlineKeyboardButton(
             text=_("cancel"),
-            callback_data=AdCallbackFactory(action="ad_menu").pack()
+            callback_data=_CB_AD_MENU
         )]
     ])
 
 
+@cache_per_locale
 def get_campaign_confirmation_keyboard():
     """Клавиатура для подтверждения создания кампании"""
     return InlineKeyboardMarkup(inline_keyboard=[
@@ -299,7 +355,7 @@ def get_campaign_confirmation_keyboard():
         )],
         [InlineKeyboardButton(
             text=_("cancel"),
-            callback_data=AdCallbackFactory(action="ad_menu").pack()
+            callback_data=_CB_AD_MENU
         )]
     ])
 
@@ -309,55 +365,44 @@ def get_campaign_created_keyboard(campaign_id):
     return InlineKeyboardMarkup(inline_keyboard=[
         [InlineKeyboardButton(
             text=_("view-campaign"),
-            callback_data=AdCallbackFactory(
-                action="campaign_details", 
-                item_id=campaign_id
-            ).pack()
+            callback_data=pack_callback(
+                AdCallbackFactory, "campaign_details", "advertiser", campaign_id, None
+            )
         )],
         [InlineKeyboardButton(
             text=_("my-campaigns"),
-            callback_data=AdCallbackFactory(action="my_campaigns").pack()
+            callback_data=_CB_MY_CAMPAIGNS
         )],
-        [InlineKeyboardButton(
-            text=_("back-to-ad-menu"),
-            callback_data=AdCallbackFactory(action="ad_menu").pack()
-        )]
+        [_get_back_to_ad_menu_button(get_i18n().current_locale)]
     ])
 
 
+@cache_per_locale
 def get_admin_ad_menu() -> InlineKeyboardMarkup:
     """Клавиатура админского меню рекламы"""
     keyboard = [
         [
             InlineKeyboardButton(
                 text=_("moderate-ads"),
-                callback_data=AdCallbackFactory(
-                    action="moderate_ads", role="admin"
-                ).pack(),
+                callback_data=_CB_MODERATE_ADS_ADMIN,
             )
         ],
         [
             InlineKeyboardButton(
                 text=_("all-campaigns"),
-                callback_data=AdCallbackFactory(
-                    action="all_campaigns", role="admin"
-                ).pack(),
+                callback_data=_CB_ALL_CAMPAIGNS_ADMIN,
             )
         ],
         [
             InlineKeyboardButton(
                 text=_("advertiser-management"),
-                callback_data=AdCallbackFactory(
-                    action="advertiser_management", role="admin"
-                ).pack(),
+                callback_data=_CB_ADVERTISER_MANAGEMENT,
             )
         ],
         [
             InlineKeyboardButton(
                 text=_("ad-analytics-admin"),
-                callback_data=AdCallbackFactory(
-                    action="analytics_admin", role="admin"
-                ).pack(),
+                callback_data=_CB_ANALYTICS_ADMIN,
             )
         ],
         [get_admin_back_to_menu()],
@@ -367,299 +412,234 @@ def get_admin_ad_menu() -> InlineKeyboardMarkup:
 
 def get_moderation_queue_keyboard(creatives=None, page=1) -> InlineKeyboardMarkup:
     """Клавиатура для очереди модерации креативов"""
-    keyboard = []
-    
-    # Добавляем кнопки для каждого креатива на модерации
-    if creatives:
-        for creative in creatives[:10]:  # Ограничиваем до 10 креативов на страницу
-            # Получаем информацию о кампании
-            campaign_name = creative.campaign.name if creative.campaign else "Unknown"
-            
-            keyboard.append(
-                [
-                    InlineKeyboardButton(
-                        text=f"📝 {campaign_name[:15]}{'...' if len(campaign_name) > 15 else ''} - {creative.creative_type}",
-                        callback_data=AdCallbackFactory(
-                            action="moderate_creative", item_id=creative.id, role="admin"
-                        ).pack(),
-                    )
-                ]
-            )
-    
-    # Если креативов нет
+    locale = get_i18n().current_locale
+    # Пустая очередь не зависит от данных - берем готовую клавиатуру для локали
     if not creatives:
-        keyboard.append(
-            [
-                InlineKeyboardButton(
-                    text=_("no-pending-creatives"),
-                    callback_data="dummy"
-                )
-            ]
-        )
+        return _get_empty_moderation_queue_keyboard(locale)
+
+    # Добавляем кнопки для каждого креатива на модерации (не больше PAGE_SIZE)
+    keyboard = [
+        [
+            InlineKeyboardButton(
+                text=(
+                    f"📝 {_ellipsize(_name_or_unknown(creative.campaign), 15)}"
+                    f" - {creative.creative_type}"
+                ),
+                callback_data=pack_callback(
+                    AdCallbackFactory, "moderate_creative", "admin", creative.id, None
+                ),
+            )
+        ]
+        for creative in islice(creatives, PAGE_SIZE)
+    ]
     
-    # Если креативов больше 10, добавляем пагинацию
-    if creatives and len(creatives) > 10:
+    # Если креативов больше, чем помещается на страницу, добавляем пагинацию
+    if len(creatives) > PAGE_SIZE:
         pagination_buttons = [
             InlineKeyboardButton(
-                text=_("show-more-creatives"),
-                callback_data=AdCallbackFactory(
-                    action="moderation_page",
-                    item_id=page + 1,
-                    role="admin"
-                ).pack(),
+                text=translate("show-more-creatives", locale),
+                callback_data=pack_callback(
+                    AdCallbackFactory, "moderation_page", "admin", page + 1, None
+                ),
             )
         ]
         keyboard.append(pagination_buttons)
     
     # Кнопка обновления и возврата
-    keyboard.extend([
-        [
-            InlineKeyboardButton(
-                text=_("refresh-queue"),
-                callback_data=AdCallbackFactory(
-                    action="moderate_ads", role="admin"
-                ).pack(),
-            )
-        ],
-        [
-            InlineKeyboardButton(
-                text=_("back-to-admin-menu"),
-                callback_data=AdCallbackFactory(
-                    action="admin_ad_menu", role="admin"
-                ).pack(),
-            )
-        ]
-    ])
+    keyboard.extend(_get_moderation_queue_footer(locale))
     
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
 
-def get_creative_moderation_keyboard(creative_id: int) -> InlineKeyboardMarkup:
-    """Клавиатура для модерации конкретного креатива"""
-    keyboard = [
+def _get_moderation_queue_footer(locale: str) -> list:
+    """Кнопки обновления очереди и возврата в админское меню"""
+    return [
         [
             InlineKeyboardButton(
-                text=_("approve-creative"),
-                callback_data=AdCallbackFactory(
-                    action="approve_creative", item_id=creative_id, role="admin"
-                ).pack(),
-            ),
-            InlineKeyboardButton(
-                text=_("reject-creative"),
-                callback_data=AdCallbackFactory(
-                    action="reject_creative", item_id=creative_id, role="admin"
-                ).pack(),
+                text=translate("refresh-queue", locale),
+                callback_data=_CB_MODERATE_ADS_ADMIN,
             )
         ],
+        [_get_back_to_admin_menu_button(locale)]
+    ]
+
+
+@lru_cache(maxsize=16)
+def _get_empty_moderation_queue_keyboard(locale: str) -> InlineKeyboardMarkup:
+    """Клавиатура пустой очереди модерации (кэшируется по локали)"""
+    keyboard = [
         [
             InlineKeyboardButton(
-                text=_("view-campaign"),
-                callback_data=AdCallbackFactory(
-                    action="view_creative_campaign", item_id=creative_id, role="admin"
-                ).pack(),
+                text=translate("no-pending-creatives", locale),
+                callback_data="dummy"
             )
         ],
-        [
-            InlineKeyboardButton(
-                text=_("back-to-moderation"),
-                callback_data=AdCallbackFactory(
-                    action="moderate_ads", role="admin"
-                ).pack(),
-            )
-        ]
+        *_get_moderation_queue_footer(locale),
     ]
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
 
+def get_creative_moderation_keyboard(creative_id: int) -> InlineKeyboardMarkup:
+    """Клавиатура для модерации конкретного креатива"""
+    locale = get_i18n().current_locale
+    builder = InlineKeyboardBuilder()
+
+    # Одобрить/отклонить в одном ряду, остальные кнопки по одной
+    builder.row(
+        InlineKeyboardButton(
+            text=translate("approve-creative", locale),
+            callback_data=pack_callback(
+                AdCallbackFactory, "approve_creative", "admin", creative_id, None
+            ),
+        ),
+        InlineKeyboardButton(
+            text=translate("reject-creative", locale),
+            callback_data=pack_callback(
+                AdCallbackFactory, "reject_creative", "admin", creative_id, None
+            ),
+        ),
+    )
+    builder.row(
+        InlineKeyboardButton(
+            text=translate("view-campaign", locale),
+            callback_data=pack_callback(
+                AdCallbackFactory, "view_creative_campaign", "admin", creative_id, None
+            ),
+        )
+    )
+    builder.row(
+        InlineKeyboardButton(
+            text=translate("back-to-moderation", locale),
+            callback_data=_CB_MODERATE_ADS_ADMIN,
+        )
+    )
+
+    return builder.as_markup()
+
+
 def get_rejection_reason_keyboard(creative_id: int) -> InlineKeyboardMarkup:
     """Клавиатура для выбора причины отклонения креатива"""
+    locale = get_i18n().current_locale
+
+    # Готовые причины отклонения, затем своя причина и возврат к креативу
     keyboard = [
         [
             InlineKeyboardButton(
-                text=_("inappropriate-content"),
-                callback_data=AdCallbackFactory(
-                    action="reject_reason", item_id=creative_id, role="admin", extra="inappropriate"
-                ).pack(),
-            )
-        ],
-        [
-            InlineKeyboardButton(
-                text=_("misleading-info"),
-                callback_data=AdCallbackFactory(
-                    action="reject_reason", item_id=creative_id, role="admin", extra="misleading"
-                ).pack(),
-            )
-        ],
-        [
-            InlineKeyboardButton(
-                text=_("poor-quality"),
-                callback_data=AdCallbackFactory(
-                    action="reject_reason", item_id=creative_id, role="admin", extra="quality"
-                ).pack(),
-            )
-        ],
-        [
-            InlineKeyboardButton(
-                text=_("policy-violation"),
-                callback_data=AdCallbackFactory(
-                    action="reject_reason", item_id=creative_id, role="admin", extra="policy"
-                ).pack(),
+                text=translate(label, locale),
+                callback_data=pack_callback(
+                    AdCallbackFactory, "reject_reason", "admin", creative_id, reason
+                ),
             )
-        ],
+        ]
+        for label, reason in _REJECT_REASONS
+    ]
+    keyboard.append(
         [
             InlineKeyboardButton(
-                text=_("custom-reason"),
-                callback_data=AdCallbackFactory(
-                    action="reject_custom", item_id=creative_id, role="admin"
-                ).pack(),
+                text=translate("custom-reason", locale),
+                callback_data=pack_callback(
+                    AdCallbackFactory, "reject_custom", "admin", creative_id, None
+                ),
             )
-        ],
+        ]
+    )
+    keyboard.append(
         [
             InlineKeyboardButton(
-                text=_("back-to-creative"),
-                callback_data=AdCallbackFactory(
-                    action="moderate_creative", item_id=creative_id, role="admin"
-                ).pack(),
+                text=translate("back-to-creative", locale),
+                callback_data=pack_callback(
+                    AdCallbackFactory, "moderate_creative", "admin", creative_id, None
+                ),
             )
         ]
-    ]
+    )
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
 
 def get_all_campaigns_keyboard(campaigns, page=1, total_pages=1) -> InlineKeyboardMarkup:
     """Клавиатура для отображения всех кампаний с пагинацией"""
-    keyboard = []
-    
     # Добавляем кнопки для каждой кампании на странице
-    for campaign in campaigns:
-        # Определяем эмодзи статуса
-        status_emoji = {
-            "active": "🟢",
-            "paused": "⏸️", 
-            "completed": "✅",
-            "draft": "📝",
-            "pending": "⏳"
-        }.get(campaign.status, "❓")
-        
-        # Получаем имя рекламодателя
-        advertiser_name = campaign.advertiser.name if campaign.advertiser else "Unknown"
-        
-        keyboard.append([
+    keyboard = [
+        [
             InlineKeyboardButton(
-                text=f"{status_emoji} {campaign.name[:20]}{'...' if len(campaign.name) > 20 else ''} | {advertiser_name[:15]}{'...' if len(advertiser_name) > 15 else ''}",
-                callback_data=AdCallbackFactory(
-                    action="view_campaign_details",
-                    item_id=campaign.id,
-                    role="admin"
-                ).pack()
-            )
-        ])
-    
-    # Добавляем навигацию если есть несколько страниц
-    if total_pages > 1:
-        nav_buttons = []
-        
-        if page > 1:
-            nav_buttons.append(
-                InlineKeyboardButton(
-                    text="⬅️ Назад",
-                    callback_data=AdCallbackFactory(
-                        action="all_campaigns",
-                        item_id=page - 1,
-                        role="admin"
-                    ).pack()
-                )
-            )
-        
-        if page < total_pages:
-            nav_buttons.append(
-                InlineKeyboardButton(
-                    text="Вперед ➡️",
-                    callback_data=AdCallbackFactory(
-                        action="all_campaigns",
-                        item_id=page + 1,
-                        role="admin"
-                    ).pack()
-                )
+                text=(
+                    f"{_ADMIN_CAMPAIGN_STATUS_EMOJI.get(campaign.status, '❓')} "
+                    f"{_ellipsize(campaign.name, 20)} | "
+                    f"{_ellipsize(_name_or_unknown(campaign.advertiser), 15)}"
+                ),
+                callback_data=pack_callback(
+                    AdCallbackFactory,
+                    "view_campaign_details",
+                    "admin",
+                    campaign.id,
+                    None,
+                ),
             )
-        
-        if nav_buttons:
-            keyboard.append(nav_buttons)
+        ]
+        for campaign in campaigns
+    ]
     
-    # Кнопка возврата в админское меню
-    keyboard.append([
-        InlineKeyboardButton(
-            text=_("back-to-admin-menu"),
-            callback_data=AdCallbackFactory(
-                action="admin_ad_menu",
-                role="admin"
-            ).pack()
-        )
-    ])
+    # Навигация по страницам и возврат в админское меню добавляются разом
+    keyboard.extend(_get_admin_page_footer("all_campaigns", page, total_pages))
     
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
 
 def get_all_advertisers_keyboard(advertisers, page=1, total_pages=1) -> InlineKeyboardMarkup:
     """Клавиатура для отображения всех рекламодателей с пагинацией"""
-    keyboard = []
-    
-    # Добавляем кнопки для каждого рекламодателя на странице
-    for advertiser in advertisers:
-        # Определяем статус по балансу
-        balance_emoji = "💰" if advertiser.balance > 0 else "💸"
-        
-        keyboard.append([
+    # Добавляем кнопки для каждого рекламодателя на странице,
+    # эмодзи показывает, есть ли у него положительный баланс
+    keyboard = [
+        [
             InlineKeyboardButton(
-                text=f"{balance_emoji} {advertiser.name[:25]}{'...' if len(advertiser.name) > 25 else ''} | {advertiser.balance}₽",
-                callback_data=AdCallbackFactory(
-                    action="view_advertiser_details",
-                    item_id=advertiser.id,
-                    role="admin"
-                ).pack()
+                text=(
+                    f"{_BALANCE_EMOJI[advertiser.balance > 0]} "
+                    f"{_ellipsize(advertiser.name, 25)} | {advertiser.balance}₽"
+                ),
+                callback_data=pack_callback(
+                    AdCallbackFactory,
+                    "view_advertiser_details",
+                    "admin",
+                    advertiser.id,
+                    None,
+                ),
             )
-        ])
+        ]
+        for advertiser in advertisers
+    ]
     
-    # Добавляем навигацию если есть несколько страниц
+    # Навигация по страницам и возврат в админское меню добавляются разом
+    keyboard.extend(_get_admin_page_footer("advertiser_management", page, total_pages))
+    
+    return InlineKeyboardMarkup(inline_keyboard=keyboard)
+
+
+def _get_admin_page_footer(action: str, page: int, total_pages: int) -> list:
+    """Строки навигации по страницам (если страниц несколько) и возврата в меню"""
+    footer = []
+
     if total_pages > 1:
         nav_buttons = []
-        
         if page > 1:
             nav_buttons.append(
                 InlineKeyboardButton(
                     text="⬅️ Назад",
-                    callback_data=AdCallbackFactory(
-                        action="advertiser_management",
-                        item_id=page - 1,
-                        role="admin"
-                    ).pack()
+                    callback_data=pack_callback(
+                        AdCallbackFactory, action, "admin", page - 1, None
+                    ),
                 )
             )
-        
         if page < total_pages:
             nav_buttons.append(
                 InlineKeyboardButton(
                     text="Вперед ➡️",
-                    callback_data=AdCallbackFactory(
-                        action="advertiser_management",
-                        item_id=page + 1,
-                        role="admin"
-                    ).pack()
+                    callback_data=pack_callback(
+                        AdCallbackFactory, action, "admin", page + 1, None
+                    ),
                 )
             )
-        
         if nav_buttons:
-            keyboard.append(nav_buttons)
-    
-    # Кнопка возврата в админское меню
-    keyboard.append([
-        InlineKeyboardButton(
-            text=_("back-to-admin-menu"),
-            callback_data=AdCallbackFactory(
-                action="admin_ad_menu",
-                role="admin"
-            ).pack()
-        )
-    ])
-    
-    return InlineKeyboardMarkup(inline_keyboard=keyboard)
+            footer.append(nav_buttons)
+
+    footer.append([_get_back_to_admin_menu_button(get_i18n().current_locale)])
+    return footer
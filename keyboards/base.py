@@ -1,7 +1,9 @@
 """Базовые классы для создания клавиатур."""
 
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
 
 from aiogram.types import (
     InlineKeyboardButton,
@@ -9,14 +11,69 @@ from aiogram.types import (
     KeyboardButton,
     ReplyKeyboardMarkup,
 )
-from aiogram.utils.keyboard import InlineKeyboardBuilder, ReplyKeyboardBuilder
+from aiogram.utils.keyboard import ReplyKeyboardBuilder
+
+
+@dataclass(slots=True)
+class _Button:
+    """Описание кнопки до сборки клавиатуры."""
+
+    text: str
+    callback_data: str | None = None
+    url: str | None = None
+    request_contact: bool | None = False
+    request_location: bool | None = False
+    row_separator: bool = False
+
+
+# Разделитель строк (общий, кнопкой не является)
+_ROW_SEPARATOR = _Button(text="", row_separator=True)
+
+# Пустая inline клавиатура (общая, клавиатуры после сборки не изменяются)
+_EMPTY_INLINE_MARKUP = InlineKeyboardMarkup(inline_keyboard=[])
+
+# Максимум кнопок в строке без заданного макета (как у InlineKeyboardBuilder)
+MAX_ROW_WIDTH = 8
+
+# Больше кнопок Telegram в одной inline-клавиатуре не покажет
+MAX_INLINE_BUTTONS = 100
+
+
+@lru_cache(maxsize=4)
+def _get_empty_reply_markup(
+    resize_keyboard: bool, one_time_keyboard: bool
+) -> ReplyKeyboardMarkup:
+    """Пустая reply клавиатура (одна на сочетание настроек)."""
+    return ReplyKeyboardMarkup(
+        keyboard=[],
+        resize_keyboard=resize_keyboard,
+        one_time_keyboard=one_time_keyboard,
+    )
+
+
+def _split_by_layout(buttons: list, layout: list[int]) -> list[list]:
+    """Разбить кнопки на строки по размерам из макета.
+
+    Последний размер повторяется для оставшихся кнопок, как в
+    InlineKeyboardBuilder.adjust().
+    """
+    rows = []
+    position = 0
+    last_index = len(layout) - 1
+    while position < len(buttons):
+        size = layout[min(len(rows), last_index)]
+        rows.append(buttons[position : position + size])
+        position += size
+    return rows
 
 
 class BaseKeyboardBuilder(ABC):
     """Базовый класс для создания клавиатур."""
 
+    __slots__ = ("_buttons", "_layout")
+
     def __init__(self):
-        self._buttons: list[dict[str, Any]] = []
+        self._buttons: list[_Button] = []
         self._layout: list[int] | None = None
 
     @abstractmethod
@@ -32,13 +89,16 @@ class BaseKeyboardBuilder(ABC):
         **kwargs,
     ) -> "BaseKeyboardBuilder":
         """Добавить кнопку."""
-        button_data = {
-            "text": text,
-            "callback_data": callback_data,
-            "url": url,
-            **kwargs,
-        }
-        self._buttons.append(button_data)
+        self._buttons.append(_Button(text, callback_data, url, **kwargs))
+        return self
+
+    def add_buttons(
+        self, buttons: Iterable[tuple[str, str | None]]
+    ) -> "BaseKeyboardBuilder":
+        """Добавить кнопки из пар (текст, callback_data) одним вызовом."""
+        self._buttons.extend(
+            _Button(text, callback_data) for text, callback_data in buttons
+        )
         return self
 
     def add_button_object(
@@ -47,25 +107,21 @@ class BaseKeyboardBuilder(ABC):
         """Добавить готовую кнопку."""
         if isinstance(button, InlineKeyboardButton):
             self._buttons.append(
-                {
-                    "text": button.text,
-                    "callback_data": button.callback_data,
-                    "url": button.url,
-                }
+                _Button(button.text, button.callback_data, button.url)
             )
         elif isinstance(button, KeyboardButton):
             self._buttons.append(
-                {
-                    "text": button.text,
-                    "request_contact": getattr(button, "request_contact", None),
-                    "request_location": getattr(button, "request_location", None),
-                }
+                _Button(
+                    button.text,
+                    request_contact=button.request_contact,
+                    request_location=button.request_location,
+                )
             )
         return self
 
     def add_row(self) -> "BaseKeyboardBuilder":
         """Добавить новую строку (разделитель)."""
-        self._buttons.append({"_row_separator": True})
+        self._buttons.append(_ROW_SEPARATOR)
         return self
 
     def set_layout(self, layout: list[int]) -> "BaseKeyboardBuilder":
@@ -83,31 +139,58 @@ class BaseKeyboardBuilder(ABC):
 class InlineKeyboardFactory(BaseKeyboardBuilder):
     """Фабрика для создания inline клавиатур."""
 
+    __slots__ = ()
+
     def build(self) -> InlineKeyboardMarkup:
         """Создать inline клавиатуру."""
-        builder = InlineKeyboardBuilder()
+        if not self._buttons:
+            return _EMPTY_INLINE_MARKUP
 
+        if self._layout:
+            # Макет задает размеры строк, разделители строк не учитываются
+            buttons = [
+                InlineKeyboardButton(
+                    text=button_data.text,
+                    callback_data=button_data.callback_data,
+                    url=button_data.url,
+                )
+                for button_data in self._buttons
+                if not button_data.row_separator
+            ]
+            return InlineKeyboardMarkup(
+                inline_keyboard=_split_by_layout(buttons, self._layout)
+            )
+
+        rows: list[list[InlineKeyboardButton]] = []
+        row: list[InlineKeyboardButton] = []
         for button_data in self._buttons:
-            if button_data.get("_row_separator"):
-                builder.row()
+            if button_data.row_separator:
+                if row:
+                    rows.append(row)
+                    row = []
                 continue
 
-            button = InlineKeyboardButton(
-                text=button_data["text"],
-                callback_data=button_data.get("callback_data"),
-                url=button_data.get("url"),
+            if len(row) >= MAX_ROW_WIDTH:
+                rows.append(row)
+                row = []
+            row.append(
+                InlineKeyboardButton(
+                    text=button_data.text,
+                    callback_data=button_data.callback_data,
+                    url=button_data.url,
+                )
             )
-            builder.add(button)
+        if row:
+            rows.append(row)
 
-        if self._layout:
-            builder.adjust(*self._layout)
-
-        return builder.as_markup()
+        return InlineKeyboardMarkup(inline_keyboard=rows)
 
 
 class ReplyKeyboardFactory(BaseKeyboardBuilder):
     """Фабрика для создания reply клавиатур."""
 
+    __slots__ = ("resize_keyboard", "one_time_keyboard")
+
     def __init__(self, resize_keyboard: bool = True, one_time_keyboard: bool = False):
         super().__init__()
         self.resize_keyboard = resize_keyboard
@@ -115,17 +198,20 @@ class ReplyKeyboardFactory(BaseKeyboardBuilder):
 
     def build(self) -> ReplyKeyboardMarkup:
         """Создать reply клавиатуру."""
+        if not self._buttons:
+            return _get_empty_reply_markup(self.resize_keyboard, self.one_time_keyboard)
+
         builder = ReplyKeyboardBuilder()
 
         for button_data in self._buttons:
-            if button_data.get("_row_separator"):
+            if button_data.row_separator:
                 builder.row()
                 continue
 
             button = KeyboardButton(
-                text=button_data["text"],
-                request_contact=button_data.get("request_contact", False),
-                request_location=button_data.get("request_location", False),
+                text=button_data.text,
+                request_contact=button_data.request_contact,
+                request_location=button_data.request_location,
             )
             builder.add(button)
 
@@ -152,23 +238,3 @@ class KeyboardBuilder:
     ) -> ReplyKeyboardFactory:
         """Создать reply клавиатуру."""
         return ReplyKeyboardFactory(resize_keyboard, one_time_keyboard)
-
-
-# Миксин для добавления общих методов в существующие классы
-class KeyboardMixin:
-    """Миксин с общими методами для клавиатур."""
-
-    @staticmethod
-    def create_back_button(text: str, callback_data: str) -> InlineKeyboardButton:
-        """Создать кнопку возврата."""
-        return InlineKeyboardButton(text=text, callback_data=callback_data)
-
-    @staticmethod
-    def create_url_button(text: str, url: str) -> InlineKeyboardButton:
-        """Создать кнопку с URL."""
-        return InlineKeyboardButton(text=text, url=url)
-
-    @staticmethod
-    def create_callback_button(text: str, callback_data: str) -> InlineKeyboardButton:
-        """Создать кнопку с callback_data."""
-        return InlineKeyboardButton(text=text, callback_data=callback_data)
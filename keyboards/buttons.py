@@ -1,5 +1,8 @@
+from functools import lru_cache, wraps
+
 from aiogram.filters.callback_data import CallbackData
 from aiogram.types.inline_keyboard_button import InlineKeyboardButton
+from aiogram.utils.i18n import get_i18n
 from aiogram.utils.i18n import gettext as _
 
 
@@ -26,9 +29,66 @@ class AdCallbackFactory(CallbackData, prefix="ad"):
     action: str
     role: str = "advertiser"  # "advertiser" или "admin"
     item_id: int | None = None
+    extra: str | None = None  # дополнительный параметр (например, причина отклонения)
+
+
+def _encode_callback_value(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return str(int(value))
+    return str(value)
+
+
+def pack_callback(factory: type[CallbackData], *values) -> str:
+    """Собирает callback_data фабрики без создания pydantic-модели
+
+    Значения передаются для всех полей фабрики в порядке их объявления и
+    кодируются так же, как в CallbackData.pack(): None - пустая строка,
+    bool - 0/1. Используется в циклах построения клавиатур; для разбора
+    входящих колбэков по-прежнему используется сама фабрика.
+    """
+    return factory.__separator__.join(
+        (factory.__prefix__, *map(_encode_callback_value, values))
+    )
+
 
+@lru_cache(maxsize=1024)
+def _translate(locale: str, key: str) -> str:
+    return _(key, locale=locale)
 
-# Функции для создания кнопок (вызываются после инициализации I18n)
+
+def translate(key: str, locale: str | None = None) -> str:
+    """Перевод строки без параметров, кэшируется по локали и ключу
+
+    Без locale используется язык текущего запроса. Единый кэш переводов
+    для подписей кнопок, названий статусов и фильтров.
+    """
+    return _translate(locale or get_i18n().current_locale, key)
+
+
+def cache_per_locale(builder):
+    """Кэширует результат функции без параметров отдельно для каждой локали
+
+    Подходит для кнопок и клавиатур, которые зависят только от языка.
+    Сбросить кэш можно через <функция>.cache_clear().
+    """
+
+    @lru_cache(maxsize=16)
+    def cached(_locale: str):
+        return builder()
+
+    @wraps(builder)
+    def wrapper():
+        return cached(get_i18n().current_locale)
+
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+# Функции для создания кнопок (вызываются после инициализации I18n).
+# Кнопки зависят только от языка, поэтому создаются один раз на локаль
+@cache_per_locale
 def get_user_back_to_menu() -> InlineKeyboardButton:
     return InlineKeyboardButton(
         text=_("back-to-menu"),
@@ -36,6 +96,7 @@ def get_user_back_to_menu() -> InlineKeyboardButton:
     )
 
 
+@cache_per_locale
 def get_change_language() -> InlineKeyboardButton:
     return InlineKeyboardButton(
         text=_("change-language"),
@@ -43,6 +104,7 @@ def get_change_language() -> InlineKeyboardButton:
     )
 
 
+@cache_per_locale
 def get_ad_menu() -> InlineKeyboardButton:
     return InlineKeyboardButton(
         text=_("ad-menu"),
@@ -50,6 +112,7 @@ def get_ad_menu() -> InlineKeyboardButton:
     )
 
 
+@cache_per_locale
 def get_admin_ad_menu() -> InlineKeyboardButton:
     return InlineKeyboardButton(
         text=_("admin-ad-menu"),
@@ -57,6 +120,7 @@ def get_admin_ad_menu() -> InlineKeyboardButton:
     )
 
 
+@cache_per_locale
 def get_add_group() -> InlineKeyboardButton:
     return InlineKeyboardButton(
         text=_("add-group"),
@@ -64,6 +128,7 @@ def get_add_group() -> InlineKeyboardButton:
     )
 
 
+@cache_per_locale
 def get_group_back_to_menu() -> InlineKeyboardButton:
     return InlineKeyboardButton(
         text=_("back-to-menu"),
@@ -71,6 +136,7 @@ def get_group_back_to_menu() -> InlineKeyboardButton:
     )
 
 
+@cache_per_locale
 def get_my_groups() -> InlineKeyboardButton:
     return InlineKeyboardButton(
         text=_("my-groups"),
@@ -78,6 +144,7 @@ def get_my_groups() -> InlineKeyboardButton:
     )
 
 
+@cache_per_locale
 def get_admin_back_to_menu() -> InlineKeyboardButton:
     return InlineKeyboardButton(
         text=_("back-to-menu"),
@@ -85,6 +152,7 @@ def get_admin_back_to_menu() -> InlineKeyboardButton:
     )
 
 
+@cache_per_locale
 def get_filters_menu() -> InlineKeyboardButton:
     return InlineKeyboardButton(
         text=_("filters-menu"),
@@ -119,6 +187,13 @@ def get_main_menu_keyboard(user_role: str):
     Returns:
         InlineKeyboardMarkup: Клавиатура главного меню
     """
+    # Клавиатура зависит только от роли и языка - берем готовую из кэша
+    return _get_main_menu_keyboard(user_role, get_i18n().current_locale)
+
+
+@lru_cache(maxsize=4)
+def _get_main_menu_keyboard(user_role: str, _locale: str):
+    """Клавиатура главного меню (кэшируется по роли и локали)"""
     # Импортируем здесь, чтобы избежать циклических импортов
     from keyboards.admins import get_admin_main_menu
     from keyboards.user import get_user_main_menu
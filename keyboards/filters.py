@@ -1,13 +1,16 @@
 from aiogram.filters.callback_data import CallbackData
+from aiogram.utils.i18n import get_i18n
 from aiogram.utils.i18n import gettext as _
 from database.models import FilterRule, Group
 
 from keyboards.buttons import (
     AdminCallbackFactory,
     get_admin_back_to_menu,
+    pack_callback,
+    translate,
 )
 
-from .base import KeyboardBuilder
+from .base import MAX_INLINE_BUTTONS, KeyboardBuilder
 
 
 class FiltersCallbackFactory(CallbackData, prefix="filters"):
@@ -19,18 +22,46 @@ class FiltersCallbackFactory(CallbackData, prefix="filters"):
     value: bool | int | None = None
 
 
+# Отметка включенного/выключенного фильтра, индексируется значением bool
+TOGGLE_EMOJI = ("❌", "✅")
+
+# Базовые фильтры в меню: поле -> ключ перевода названия
+FILTER_NAME_KEYS = {
+    "hashtag": "filter-hashtag",
+    "url": "filter-url",
+    "email": "filter-email",
+    "ads": "filter-ads",
+    "phone_number": "filter-phone-number",
+    "forbidden_words": "filter-forbidden-words",
+    "track_members": "filter-track-members",
+    "captcha": "filter-captcha",
+    "max_message_length": "filter-max-message-length",
+}
+
+# Базовые фильтры, которые есть в модели FilterRule (определяется один раз)
+FILTER_FIELDS = tuple(
+    field_name
+    for field_name in FILTER_NAME_KEYS
+    if field_name in FilterRule.__table__.columns
+)
+
+
+# Групп в списке для меню фильтров: после них добавляется кнопка "Назад"
+FILTERS_GROUPS_LIST_LIMIT = MAX_INLINE_BUTTONS - 1
+
+
 def get_groups_list_for_filters(groups: list[Group]):
     """Создает клавиатуру со списком групп для меню фильтров"""
     keyboard = KeyboardBuilder.inline()
 
     # Добавляем кнопки групп
-    for group in groups:
-        keyboard.add_button(
-            text=f"{group.title}",
-            callback_data=FiltersCallbackFactory(
-                action="filters", group_id=group.id
-            ).pack(),
+    keyboard.add_buttons(
+        (
+            group.title,
+            pack_callback(FiltersCallbackFactory, "filters", group.id, None, None),
         )
+        for group in groups
+    )
 
     keyboard.set_layout([1])
 
@@ -45,59 +76,48 @@ def get_filters_list_for_group(filters: FilterRule):
     """Создает клавиатуру со списком фильтров для группы"""
     keyboard = KeyboardBuilder.inline()
 
-    # Словарь с названиями фильтров и их переводами
-    filter_names = {
-        "hashtag": _("filter-hashtag"),
-        "url": _("filter-url"),
-        "email": _("filter-email"),
-        "ads": _("filter-ads"),
-        "phone_number": _("filter-phone-number"),
-        "forbidden_words": _("filter-forbidden-words"),
-        "track_members": _("filter-track-members"),
-        "captcha": _("filter-captcha"),
-        "max_message_length": _("filter-max-message-length"),
-    }
+    locale = get_i18n().current_locale
 
     # Добавляем кнопки для базовых фильтров
-    for field_name, display_name in filter_names.items():
-        if hasattr(filters, field_name):
-            value = getattr(filters, field_name)
-            # Добавляем эмодзи в зависимости от значения
-            if isinstance(value, bool):
-                emoji = "✅" if value else "❌"
-                text = f"{emoji} {display_name}"
-            else:
-                text = f"⚙️ {display_name}: {value}"
+    for field_name in FILTER_FIELDS:
+        display_name = translate(FILTER_NAME_KEYS[field_name], locale)
+        value = getattr(filters, field_name)
+        # Добавляем эмодзи в зависимости от значения
+        if isinstance(value, bool):
+            emoji = TOGGLE_EMOJI[value]
+            text = f"{emoji} {display_name}"
+        else:
+            text = f"⚙️ {display_name}: {value}"
 
-            keyboard.add_button(
-                text=text,
-                callback_data=FiltersCallbackFactory(
-                    action="update", group_id=filters.id, key=field_name, value=value
-                ).pack(),
-            )
+        keyboard.add_button(
+            text=text,
+            callback_data=pack_callback(
+                FiltersCallbackFactory, "update", filters.id, field_name, value
+            ),
+        )
 
     # Условное добавление кнопки "Настройка каптчи" только если captcha включена
-    if hasattr(filters, "captcha") and filters.captcha:
+    if filters.captcha:
         keyboard.add_button(
             text=_("captcha-settings"),
-            callback_data=FiltersCallbackFactory(
-                action="captcha_settings", group_id=filters.id
-            ).pack(),
+            callback_data=pack_callback(
+                FiltersCallbackFactory, "captcha_settings", filters.id, None, None
+            ),
         )
 
     # Условное добавление кнопки bonuses_enabled только если track_members включен
-    if hasattr(filters, "track_members") and filters.track_members:
+    if filters.track_members:
         field_name = "bonuses_enabled"
         display_name = _("filter-bonuses-enabled")
         value = getattr(filters, field_name)
-        emoji = "✅" if value else "❌"
+        emoji = TOGGLE_EMOJI[bool(value)]
         text = f"{emoji} {display_name}"
 
         keyboard.add_button(
             text=text,
-            callback_data=FiltersCallbackFactory(
-                action="update", group_id=filters.id, key=field_name, value=value
-            ).pack(),
+            callback_data=pack_callback(
+                FiltersCallbackFactory, "update", filters.id, field_name, value
+            ),
         )
 
         # Условное добавление кнопок bonus_per_user и bonus_checkpoint только если bonuses_enabled включен
@@ -109,12 +129,9 @@ def get_filters_list_for_group(filters: FilterRule):
 
                 keyboard.add_button(
                     text=text,
-                    callback_data=FiltersCallbackFactory(
-                        action="update",
-                        group_id=filters.id,
-                        key=field_name,
-                        value=value,
-                    ).pack(),
+                    callback_data=pack_callback(
+                        FiltersCallbackFactory, "update", filters.id, field_name, value
+                    ),
                 )
 
     # Размещаем по 1 кнопке в ряд для лучшей читаемости
@@ -123,7 +140,7 @@ def get_filters_list_for_group(filters: FilterRule):
     # Добавляем кнопку "Назад"
     keyboard.add_button(
         text=_("back-to-groups"),
-        callback_data=AdminCallbackFactory(action="filters_menu").pack(),
+        callback_data=pack_callback(AdminCallbackFactory, "filters_menu"),
     )
 
     return keyboard.build()
@@ -136,9 +153,9 @@ def get_back_to_filter_menu(group_id: int):
     # Добавляем кнопку "Назад"
     keyboard.add_button(
         text=_("back"),
-        callback_data=FiltersCallbackFactory(
-            action="filters", group_id=group_id
-        ).pack(),
+        callback_data=pack_callback(
+            FiltersCallbackFactory, "filters", group_id, None, None
+        ),
     )
 
     return keyboard.build()
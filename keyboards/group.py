@@ -1,12 +1,20 @@
+from functools import lru_cache
+
+from aiogram.utils.i18n import get_i18n
 from database.models import Group
 
 from keyboards.buttons import (
     GroupCallbackFactory,
     get_add_group,
     get_admin_back_to_menu,
+    pack_callback,
 )
 
-from .base import KeyboardBuilder
+from .base import MAX_INLINE_BUTTONS, KeyboardBuilder
+
+
+# Групп в списке: после них добавляются кнопки "Добавить группу" и "Назад"
+GROUPS_LIST_LIMIT = MAX_INLINE_BUTTONS - 2
 
 
 def get_group_management_keyboard():
@@ -22,25 +30,32 @@ def get_group_management_keyboard():
 
 def get_groups_list_keyboard(groups: list[Group]):
     """Создает клавиатуру со списком групп для удаления"""
+    # Клавиатура зависит только от id и названий групп и языка
+    return _get_groups_list_keyboard(
+        tuple((group.id, group.title) for group in groups),
+        get_i18n().current_locale,
+    )
+
+
+def clear_groups_list_keyboard_cache() -> None:
+    """Сбрасывает кэш клавиатур списка групп (после добавления/удаления группы)"""
+    _get_groups_list_keyboard.cache_clear()
+
+
+@lru_cache(maxsize=64)
+def _get_groups_list_keyboard(groups: tuple[tuple[int, str], ...], _locale: str):
+    """Клавиатура со списком групп (кэшируется по списку групп и локали)"""
     keyboard = KeyboardBuilder.inline()
 
-    # Добавляем кнопки групп
-    for group in groups:
+    # Добавляем кнопки групп и сразу определяем их размещение:
+    # короткие названия (до 15 символов) - 2 кнопки в ряд, длинные - 1
+    layout = []
+    for group_id, title in groups:
         keyboard.add_button(
-            text=f"{group.title}",
-            callback_data=GroupCallbackFactory(
-                action="remove", group_id=group.id
-            ).pack(),
+            text=title,
+            callback_data=pack_callback(GroupCallbackFactory, "remove", group_id),
         )
-
-    # Определяем размещение кнопок в зависимости от длины текста
-    # Если текст короткий (до 20 символов) - 2 кнопки в ряд, иначе - 1
-    layout = []
-    for group in groups:
-        if len(group.title) <= 15:
-            layout.append(2)  # 2 кнопки в ряд для коротких названий
-        else:
-            layout.append(1)  # 1 кнопка в ряд для длинных названий
+        layout.append(2 if len(title) <= 15 else 1)
 
     # Применяем динамическое размещение
     if layout:
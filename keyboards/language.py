@@ -1,3 +1,6 @@
+import os
+from functools import cache
+
 from aiogram.types import InlineKeyboardButton
 from config import LOCALES_DIR
 
@@ -41,20 +44,41 @@ language_display = {
 }
 
 
-def language_list() -> list[str]:
-    # Сканируем доступные языки
+@cache
+def language_list() -> tuple[str, ...]:
+    """Доступные языки (каталоги локалей с LC_MESSAGES).
+
+    Набор локалей не меняется во время работы бота, поэтому каталог
+    сканируется один раз; для перечитывания - language_list.cache_clear().
+    """
+    if not LOCALES_DIR.exists():
+        return ()
+
     available_languages = []
-    if LOCALES_DIR.exists():
-        for item in LOCALES_DIR.iterdir():
-            if item.is_dir() and item.name != "__pycache__":
-                # Проверяем, что в папке есть LC_MESSAGES
-                lc_messages_path = item / "LC_MESSAGES"
-                if lc_messages_path.exists():
-                    available_languages.append(item.name)
+    with os.scandir(LOCALES_DIR) as entries:
+        for entry in entries:
+            # Проверяем, что в папке есть LC_MESSAGES
+            if (
+                entry.is_dir(follow_symlinks=False)
+                and entry.name != "__pycache__"
+                and os.path.isdir(os.path.join(entry.path, "LC_MESSAGES"))
+            ):
+                available_languages.append(entry.name)
 
-    # Сортируем языки для консистентности
-    available_languages.sort()
-    return available_languages
+    # Сортируем языки для консистентности; кортеж, т.к. результат общий
+    return tuple(sorted(available_languages))
+
+
+@cache
+def _language_buttons(languages: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+    """Подписи и колбэки кнопок для набора языков (считаются один раз)"""
+    return tuple(
+        (
+            language_display.get(lang_code, f"🌐 {lang_code.upper()}"),
+            f"lang:{lang_code}",
+        )
+        for lang_code in languages
+    )
 
 
 def get_language_keyboard(back_button: InlineKeyboardButton):
@@ -65,12 +89,8 @@ def get_language_keyboard(back_button: InlineKeyboardButton):
     """
     keyboard = KeyboardBuilder.inline()
 
-    available_languages = language_list()
-
     # Создаем кнопки для доступных языков
-    for lang_code in available_languages:
-        display_name = language_display.get(lang_code, f"🌐 {lang_code.upper()}")
-        keyboard.add_button(text=display_name, callback_data=f"lang:{lang_code}")
+    keyboard.add_buttons(_language_buttons(language_list()))
 
     # Добавляем кнопку возврата
     keyboard.add_button(text=back_button.text, callback_data=back_button.callback_data)
@@ -1,7 +1,9 @@
 import asyncio
 
+import orjson
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.aiohttp import AiohttpSession
 from aiogram.fsm.storage.redis import RedisStorage
 from aiogram.utils.i18n import I18n
 from cache import redis_client
@@ -11,30 +13,43 @@ from database import _db as db
 from database.unit_of_work import UnitOfWork
 from handlers import setup_routers
 from loguru import logger
-from middlewares import DbSessionMiddleware, I18nMiddleware
+from middlewares import DbSessionMiddleware, I18nMiddleware, RateLimitMiddleware
+from utilities.settings_writer import captcha_settings_writer
 
 
 async def main():
     # Инициализация базы данных при запуске приложения
     await db.initialize()
     await db.init_db()
+    logger.info("Database pool status: {}", db.pool_status())
 
     # Инициализация Redis
     await redis_client.connect()
     logger.info("Redis initialized")
 
+    # Фоновая пакетная запись настроек каптчи
+    await captcha_settings_writer.start(db)
+
     # Обновление списка администраторов из БД
     async with db.get_session() as session:
         uow = UnitOfWork(session)
         admin_manager = AdminManager(uow)
         await admin_manager.update_admin_ids_in_settings(settings)
-    logger.info(f"Admin IDs loaded from database: {settings.bot_admin_ids}")
+    logger.info(f"Admin IDs loaded from database: {sorted(settings.bot_admin_ids)}")
 
     # Bot
+    # orjson вместо stdlib json для (де)сериализации запросов к Bot API
+    session = AiohttpSession(
+        json_loads=orjson.loads,
+        json_dumps=lambda obj: orjson.dumps(obj).decode(),
+    )
     bot = Bot(
         token=settings.telegram_bot_token.get_secret_value(),
+        session=session,
         default=DefaultBotProperties(parse_mode="HTML"),
     )
+    # Ограничение частоты исходящих запросов к Bot API
+    bot.session.middleware(RateLimitMiddleware())
 
     # Инициализация хранилища состояний
     storage = RedisStorage(redis_client.redis)
@@ -50,18 +65,25 @@ async def main():
 
     # Инициализация роутеров
     await setup_routers(dp)
+    # Типы апдейтов, на которые подписаны роутеры (обход дерева один раз)
+    allowed_updates = dp.resolve_used_update_types()
+    logger.info("Allowed updates: {}", sorted(allowed_updates))
 
     dp["settings"] = settings
     # Запускаем бота
     logger.info("Starting bot")
     try:
+        # В aiogram 3 параметра skip_updates нет: накопившиеся апдейты
+        # сбрасываются явно одним запросом
+        await bot.delete_webhook(drop_pending_updates=True)
         await dp.start_polling(
             bot,
-            allowed_updates=dp.resolve_used_update_types(),
-            skip_updates=True,
+            allowed_updates=allowed_updates,
+            polling_timeout=30,
         )
     finally:
         # Закрываем соединения при завершении
+        await captcha_settings_writer.stop()
         await db.close()
         await redis_client.disconnect()
         logger.info("Bot stopped")
@@ -1,5 +1,6 @@
 from .db import DbSessionMiddleware
 from .i18n import I18nMiddleware
+from .rate_limit import RateLimitMiddleware
 
 
-__all__ = ["DbSessionMiddleware", "I18nMiddleware"]
+__all__ = ["DbSessionMiddleware", "I18nMiddleware", "RateLimitMiddleware"]
@@ -5,6 +5,53 @@ from aiogram import BaseMiddleware
 from aiogram.types import TelegramObject
 from database import Database
 from database.unit_of_work import UnitOfWork
+from loguru import logger
+
+
+class LazyUnitOfWork:
+    """UnitOfWork proxy that opens a database session on first use.
+
+    Keyboard redraws and other updates that never touch the database skip
+    session creation and UnitOfWork construction entirely.
+    """
+
+    __slots__ = ("_db", "_session", "_uow")
+
+    def __init__(self, db: Database):
+        self._db = db
+        self._session = None
+        self._uow: UnitOfWork | None = None
+
+    @property
+    def is_materialized(self) -> bool:
+        return self._uow is not None
+
+    def _materialize(self) -> UnitOfWork:
+        if self._uow is None:
+            if not self._db.session_factory:
+                raise RuntimeError("База данных не инициализирована")
+            self._session = self._db.session_factory()
+            self._uow = UnitOfWork(self._session)
+        return self._uow
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._materialize(), name)
+
+    async def __aenter__(self) -> UnitOfWork:
+        return await self._materialize().__aenter__()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self._materialize().__aexit__(exc_type, exc_val, exc_tb)
+
+    async def close(self, rollback: bool = False) -> None:
+        """Close the session if it was opened"""
+        if self._session is None:
+            return
+        try:
+            if rollback:
+                await self._session.rollback()
+        finally:
+            await self._session.close()
 
 
 class DbSessionMiddleware(BaseMiddleware):
@@ -18,6 +65,14 @@ class DbSessionMiddleware(BaseMiddleware):
         event: TelegramObject,
         data: dict[str, Any],
     ) -> Any:
-        async with self.db.get_session() as session:
-            data["uow"] = UnitOfWork(session)
-            return await handler(event, data)
+        uow = LazyUnitOfWork(self.db)
+        data["uow"] = uow
+        try:
+            result = await handler(event, data)
+        except Exception as e:
+            if uow.is_materialized:
+                logger.error(f"Ошибка в сессии базы данных: {e}")
+            await uow.close(rollback=True)
+            raise
+        await uow.close()
+        return result
@@ -1,9 +1,17 @@
+from contextlib import suppress
 from typing import Any
 
 from aiogram.enums import ChatType
-from aiogram.types import Chat, Message, TelegramObject, User
+from aiogram.types import Message, TelegramObject, User
 from aiogram.utils.i18n import I18n
 from aiogram.utils.i18n.middleware import I18nMiddleware as BaseI18nMiddleware
+from cache import cache_manager
+
+
+DEFAULT_LOCALE = "ru"
+SUPPORTED_LOCALES = frozenset({"ru", "en"})
+# Plain str value: Chat.type is a str, comparing str to str skips the enum
+PRIVATE_CHAT_TYPE = ChatType.PRIVATE.value
 
 
 class I18nMiddleware(BaseI18nMiddleware):
@@ -20,45 +28,51 @@ class I18nMiddleware(BaseI18nMiddleware):
 
     async def get_locale(self, event: TelegramObject, data: dict[str, Any]) -> str:
         """Get user locale from database or fallback to Telegram API."""
-        # Get user and chat from event
-        user = data.get("event_from_user")
-        chat = None
-
-        # Try to get chat from event
-        if isinstance(event, Message):
-            chat = event.chat
-        elif "event_chat" in data:
-            chat = data.get("event_chat")
+        # Group chats are the bulk of traffic and always use the default
+        # locale, so check the chat before anything else
+        chat = event.chat if isinstance(event, Message) else data.get("event_chat")
+        if chat is not None and chat.type != PRIVATE_CHAT_TYPE:
+            return DEFAULT_LOCALE
 
-        # Skip middleware for non-private chats, use default locale
-        if chat and isinstance(chat, Chat) and chat.type != ChatType.PRIVATE:
-            return "ru"
-
-        if user and isinstance(user, User):
-            locale = "ru"  # Default locale
+        user = data.get("event_from_user")
+        if isinstance(user, User):
+            locale = DEFAULT_LOCALE
+            # Only a locale backed by a successful DB lookup is cached, so a
+            # temporary DB error does not pin the Telegram fallback
+            cacheable = False
 
-            # Try to get user's language from database first
             try:
+                # Locale resolved on one of the previous updates
+                cached_locale = await cache_manager.get_user_locale(user.id)
+                if cached_locale:
+                    return cached_locale
+
                 # Use UnitOfWork from data that was added by DbSessionMiddleware
                 uow = data.get("uow")
                 if uow:
                     db_user = await uow.user_service.get_user_by_id(user.id)
+                    cacheable = True
                     if db_user and db_user.language_code:
                         locale = db_user.language_code
                     else:
                         # Fallback to Telegram API language_code
-                        locale = user.language_code or "ru"
+                        locale = user.language_code or DEFAULT_LOCALE
                 else:
                     # Fallback to Telegram API if UnitOfWork is not available
-                    locale = user.language_code or "ru"
+                    locale = user.language_code or DEFAULT_LOCALE
             except Exception:
                 # In case of database error, fallback to Telegram API
-                locale = user.language_code or "ru"
+                locale = user.language_code or DEFAULT_LOCALE
 
             # Ensure we only use supported locales
-            if locale not in ["ru", "en"]:
-                locale = "ru"
+            if locale not in SUPPORTED_LOCALES:
+                locale = DEFAULT_LOCALE
+
+            if cacheable:
+                # Cache is an optimization only, the locale is already resolved
+                with suppress(Exception):
+                    await cache_manager.set_user_locale(user.id, locale)
 
             return locale
 
-        return "ru"
+        return DEFAULT_LOCALE
@@ -0,0 +1,157 @@
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any
+
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType,
+)
+from aiogram.enums import ChatType
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import TelegramMethod
+from aiogram.methods.base import Response, TelegramType
+from aiogram.types import Message
+from loguru import logger
+
+
+if TYPE_CHECKING:
+    from aiogram import Bot
+
+
+# Methods that post a message into a chat and count towards the per-chat limit
+_MESSAGE_METHOD_PREFIXES = ("Send", "Copy", "Forward")
+
+# Chat types Telegram limits to 20 messages per minute
+_GROUP_CHAT_TYPES = frozenset({ChatType.GROUP.value, ChatType.SUPERGROUP.value})
+
+
+class TokenBucket:
+    """Token bucket with monotonic-clock refill."""
+
+    def __init__(self, capacity: int, refill_per_sec: float):
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated_at) * self.refill_per_sec
+        )
+        self.updated_at = now
+
+    @property
+    def is_full(self) -> bool:
+        self._refill()
+        return self.tokens >= self.capacity
+
+    async def acquire(self) -> None:
+        """Reserve a token and wait until it becomes available.
+
+        The reservation is made synchronously (tokens may go negative), so
+        waiters sleep concurrently instead of queueing behind one sleeper.
+        """
+        self._refill()
+        self.tokens -= 1
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.refill_per_sec)
+
+
+class RateLimitMiddleware(BaseRequestMiddleware):
+    """Outgoing Bot API rate limiter.
+
+    Keeps outgoing requests under Telegram limits: a global bucket for all
+    requests (30/sec) and a bucket per group chat (20/min) for methods that
+    post messages. Chat types are learned from the messages Telegram returns;
+    until then negative ids are treated as groups. On 429 responses it waits
+    for retry_after and retries, as long as the total wait stays within
+    max_retry_wait seconds.
+    """
+
+    def __init__(
+        self,
+        global_rate: int = 30,
+        group_rate_per_minute: int = 20,
+        max_retries: int = 2,
+        max_retry_wait: float = 5.0,
+        max_chat_buckets: int = 10000,
+    ):
+        self.global_bucket = TokenBucket(global_rate, global_rate)
+        self.group_rate_per_minute = group_rate_per_minute
+        self.max_retries = max_retries
+        self.max_retry_wait = max_retry_wait
+        self.max_chat_buckets = max_chat_buckets
+        self.chat_buckets: dict[Any, TokenBucket] = {}
+        self.chat_types: dict[Any, str] = {}
+
+    def _get_chat_bucket(self, chat_id: Any) -> TokenBucket:
+        bucket = self.chat_buckets.get(chat_id)
+        if bucket is None:
+            if len(self.chat_buckets) >= self.max_chat_buckets:
+                # Full buckets carry no state, drop them
+                self.chat_buckets = {
+                    key: value
+                    for key, value in self.chat_buckets.items()
+                    if not value.is_full
+                }
+            bucket = TokenBucket(
+                self.group_rate_per_minute, self.group_rate_per_minute / 60
+            )
+            self.chat_buckets[chat_id] = bucket
+        return bucket
+
+    def _is_group_chat(self, chat_id: Any) -> bool:
+        chat_type = self.chat_types.get(chat_id)
+        if chat_type is not None:
+            return chat_type in _GROUP_CHAT_TYPES
+        # Unknown chat: only negative ids can be groups (users are positive)
+        return isinstance(chat_id, int) and chat_id < 0
+
+    def _remember_chat_type(self, chat_id: Any, result: Any) -> None:
+        if isinstance(result, list):
+            result = result[0] if result else None
+        if not isinstance(result, Message):
+            return
+        if len(self.chat_types) >= self.max_chat_buckets:
+            # Evict the oldest entry (dict keeps insertion order)
+            del self.chat_types[next(iter(self.chat_types))]
+        self.chat_types[chat_id] = result.chat.type
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: "Bot",
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        # Per-chat limit applies to messages posted into groups only
+        chat_id = None
+        if type(method).__name__.startswith(_MESSAGE_METHOD_PREFIXES):
+            chat_id = getattr(method, "chat_id", None)
+            if chat_id is not None and self._is_group_chat(chat_id):
+                await self._get_chat_bucket(chat_id).acquire()
+
+        attempt = 0
+        waited = 0.0
+        while True:
+            await self.global_bucket.acquire()
+            try:
+                response = await make_request(bot, method)
+            except TelegramRetryAfter as e:
+                attempt += 1
+                waited += e.retry_after
+                if attempt > self.max_retries or waited > self.max_retry_wait:
+                    raise
+                logger.warning(
+                    "Flood control on {}, retry in {}s ({}/{})",
+                    type(method).__name__,
+                    e.retry_after,
+                    attempt,
+                    self.max_retries,
+                )
+                await asyncio.sleep(e.retry_after)
+                continue
+
+            if chat_id is not None and chat_id not in self.chat_types:
+                self._remember_chat_type(chat_id, response.result)
+            return response
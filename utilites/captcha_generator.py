@@ -1,23 +1,96 @@
-from pathlib import Path
+import asyncio
+from concurrent.futures import Executor
+from functools import lru_cache
+from io import BytesIO
 
 from database.models.captcha_setting import CaptchaSetting
 from loguru import logger
 from multicolorcaptcha import CaptchaGenerator
 
 
+# Каптчи одноразовые и Telegram все равно пережимает фото в JPEG:
+# сохраняем сразу в JPEG, это намного быстрее PNG (deflate)
+JPEG_SAVE_OPTIONS = {"quality": 75, "optimize": False, "progressive": False}
+
+
+def _encode_image(image) -> bytes:
+    """Сжать изображение каптчи в JPEG в памяти"""
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    buffer = BytesIO()
+    image.save(buffer, "JPEG", **JPEG_SAVE_OPTIONS)
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=16)
+def _get_generator(captcha_size: int) -> CaptchaGenerator:
+    """Генератор каптчи для размера (создается один раз на процесс)"""
+    return CaptchaGenerator(captcha_size)
+
+
+def render_captcha_sync(settings: dict) -> dict | None:
+    """Синхронная генерация каптчи по словарю настроек.
+
+    Чистая функция без состояния: принимает и возвращает только простые типы
+    (JPEG в байтах и ответ, без PIL.Image), поэтому её можно выполнять в
+    ProcessPoolExecutor. Файлы не пишутся, так что одновременные генерации
+    не перезаписывают друг друга. Для неизвестного типа каптчи возвращает None.
+    """
+    generator = _get_generator(int(settings["captcha_size"]))
+
+    captcha_type = settings["captcha_type"]
+    if captcha_type == "standard":
+        captcha = generator.gen_captcha_image(
+            difficult_level=settings["difficult_level"],
+            multicolor=settings["multicolor"],
+            chars_mode=settings["chars_mode"],
+            margin=settings["margin"],
+        )
+        return {
+            "image": _encode_image(captcha.image),
+            "equation": None,
+            "result": captcha.characters,
+        }
+    if captcha_type == "math":
+        math_captcha = generator.gen_math_captcha_image(
+            difficult_level=settings["difficult_level"],
+            multicolor=settings["multicolor"],
+            allow_multiplication=settings["allow_multiplication"],
+            margin=settings["margin"],
+        )
+        return {
+            "image": _encode_image(math_captcha.image),
+            "equation": math_captcha.equation_str,
+            "result": math_captcha.equation_result,
+        }
+    return None
+
+
 class CaptchaGenerators:
     def __init__(self, captcha_settings: CaptchaSetting):
         self.captcha_settings = captcha_settings
-        self.captcha_path = Path(__file__).parent / "captcha"
-        self.captcha_path.mkdir(exist_ok=True)
+        # Снимок настроек простыми значениями: атрибуты модели читаются один раз,
+        # а словарь можно передать в ProcessPoolExecutor
+        self._settings = {
+            "captcha_type": captcha_settings.captcha_type,
+            "captcha_size": int(captcha_settings.captcha_size),
+            "difficult_level": captcha_settings.difficulty_level,
+            "chars_mode": captcha_settings.chars_mode,
+            "multicolor": captcha_settings.multicolor,
+            "margin": captcha_settings.margin,
+            "allow_multiplication": captcha_settings.allow_multiplication,
+        }
 
-    async def get_captcha(self, answer: bool = False) -> str:
-        """Генерация каптчи в зависимости от настроек и возврат пути к файлу.
+    async def get_captcha(
+        self, answer: bool = False, executor: Executor | None = None
+    ) -> bytes | dict:
+        """Генерация каптчи в зависимости от настроек, возвращает JPEG в байтах.
         captcha_size_num -> 0 to 12 by default 2
         difficult_level -> 0 to 6 by default 2
         chars_mode -> "nums", "hex", "ascii" by default "nums"
         multicolor -> True or False by default False
         margin -> True or False by default True
+        executor -> пул для рендеринга (None - пул потоков event loop)
 
         Use one of the following captcha generation options:
         captcha = generator.gen_captcha_image(multicolor=False, margin=False)
@@ -30,45 +103,19 @@ class CaptchaGenerators:
         captcha = generator.gen_captcha_image(difficult_level=5, multicolor=True, chars_mode="ascii")
         """
 
-        generator = CaptchaGenerator(int(self.captcha_settings.captcha_size))
-
-        captcha_type = self.captcha_settings.captcha_type
-        file_path = self.captcha_path / f"{captcha_type}_captcha.png"
-
-        if captcha_type == "standard":
-            captcha = generator.gen_captcha_image(
-                difficult_level=self.captcha_settings.difficult_level,
-                multicolor=self.captcha_settings.multicolor,
-                chars_mode=self.captcha_settings.chars_mode,
-                margin=self.captcha_settings.margin,
-            )
-            image = captcha.image
-            characters = captcha.characters
-            logger.debug(f"Generated standard captcha. Characters: {characters}")
-            image.save(file_path, "png")
-        elif captcha_type == "math":
-            math_captcha = generator.gen_math_captcha_image(
-                difficult_level=self.captcha_settings.difficult_level,
-                multicolor=self.captcha_settings.multicolor,
-                allow_multiplication=self.captcha_settings.allow_multiplication,
-                margin=self.captcha_settings.margin,
-            )
-            image = math_captcha.image
-            equation_str = math_captcha.equation_str
-            equation_result = math_captcha.equation_result
-            logger.debug(
-                f"Generated math captcha. Equation: {equation_str}, Result: {equation_result}"
-            )
-            image.save(file_path, "png")
-        else:
-            logger.error(f"Unknown captcha type:\n{captcha_type}")
-            return ""  # Or raise an error
-
-        logger.debug(f"Captcha image saved to:\n{file_path}")
+        # Генерация и сжатие занимают процессор - выполняем вне event loop
+        # (в переданном пуле процессов или в пуле потоков по умолчанию)
+        rendered = await asyncio.get_running_loop().run_in_executor(
+            executor, render_captcha_sync, self._settings
+        )
+        if rendered is None:
+            logger.error(f"Unknown captcha type:\n{self._settings['captcha_type']}")
+            return b""  # Or raise an error
+
+        logger.debug(
+            f"Generated {self._settings['captcha_type']} captcha. "
+            f"Equation: {rendered['equation']}, Result: {rendered['result']}"
+        )
         if answer:
-            return {
-                "path": str(file_path),
-                "equation": equation_str,
-                "result": equation_result,
-            }
-        return str(file_path)
+            return rendered
+        return rendered["image"]
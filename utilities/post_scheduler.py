@@ -1,30 +1,50 @@
 # utilities/post_scheduler.py
 
 import asyncio
+import time
 from datetime import datetime
 from typing import Optional
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler.jobstores.redis import RedisJobStore
 from apscheduler.executors.asyncio import AsyncIOExecutor
+from apscheduler.jobstores.base import JobLookupError
 from loguru import logger
+from redis import ConnectionPool
 
 from ..database import get_session
+from ..database.models import PostStatus
 from ..database.unit_of_work import UnitOfWork
 
 
+# Хранилище заданий, переживающих перезапуск (публикации постов)
+PERSISTENT_JOBSTORE = 'persistent'
+
+# Размер пула соединений с Redis для хранилища заданий
+REDIS_MAX_CONNECTIONS = 32
+
+# Интервал страховочной проверки постов, запланированных в БД без date-задания
+CATCH_UP_INTERVAL_MINUTES = 1
+
+# Как часто (в секундах) обслуживание заодно снимает истекшие посты
+EXPIRE_INTERVAL_SECONDS = 3600
+
+
 class PostScheduler:
     """Планировщик постов с использованием APScheduler"""
 
     def __init__(self, redis_url: str = "redis://localhost:6379/1"):
-        # Настройка хранилища заданий в Redis
-        jobstores = {
-            'default': RedisJobStore(
-                host='localhost',
-                port=6379,
-                db=1,
-                password=None
+        # Периодические задачи пересоздаются при каждом запуске и живут в памяти,
+        # в Redis сохраняются только задания публикации постов
+        self._persistent_jobstore = RedisJobStore(
+            connection_pool=ConnectionPool.from_url(
+                redis_url, max_connections=REDIS_MAX_CONNECTIONS
             )
+        )
+        jobstores = {
+            'default': MemoryJobStore(),
+            PERSISTENT_JOBSTORE: self._persistent_jobstore
         }
         
         # Настройка исполнителей
@@ -46,6 +66,8 @@ class PostScheduler:
         )
         
         self._running = False
+        # Время (monotonic) следующей очистки истекших постов
+        self._next_expire_at = 0.0
 
     async def start(self):
         """Запуск планировщика"""
@@ -53,21 +75,21 @@ class PostScheduler:
             self.scheduler.start()
             self._running = True
             
-            # Добавляем периодическую задачу проверки постов
-            self.scheduler.add_job(
-                self._check_scheduled_posts,
-                'interval',
-                minutes=1,  # Проверяем каждую минуту
-                id='check_scheduled_posts',
-                replace_existing=True
-            )
+            # Посты публикуются date-заданиями из schedule_post; при запуске
+            # восстанавливаем их из БД
+            await self._bootstrap_schedule()
             
-            # Добавляем задачу очистки истекших постов
+            # Посты, запланированные только в БД (например, через
+            # AdminPostService.schedule_post без PostScheduler.schedule_post),
+            # публикуются этой проверкой не позже чем через интервал;
+            # раз в час в той же сессии снимаются истекшие посты
             self.scheduler.add_job(
-                self._expire_posts,
+                self._housekeeping,
                 'interval',
-                hours=1,  # Проверяем каждый час
-                id='expire_posts',
+                minutes=CATCH_UP_INTERVAL_MINUTES,
+                id='housekeeping',
+                coalesce=True,
+                max_instances=1,
                 replace_existing=True
             )
             
@@ -85,17 +107,14 @@ class PostScheduler:
         try:
             job_id = f"publish_post_{post_id}"
             
-            # Удаляем существующее задание если есть
-            if self.scheduler.get_job(job_id):
-                self.scheduler.remove_job(job_id)
-            
-            # Добавляем новое задание
+            # Существующее задание заменяется благодаря replace_existing
             self.scheduler.add_job(
                 self._publish_post,
                 'date',
                 run_date=scheduled_at,
                 args=[post_id],
                 id=job_id,
+                jobstore=PERSISTENT_JOBSTORE,
                 replace_existing=True
             )
             
@@ -111,13 +130,14 @@ class PostScheduler:
         try:
             job_id = f"publish_post_{post_id}"
             
-            if self.scheduler.get_job(job_id):
-                self.scheduler.remove_job(job_id)
-                logger.info(f"Cancelled scheduled post {post_id}")
-                return True
-            else:
+            try:
+                self.scheduler.remove_job(job_id, jobstore=PERSISTENT_JOBSTORE)
+            except JobLookupError:
                 logger.warning(f"No scheduled job found for post {post_id}")
                 return False
+
+            logger.info(f"Cancelled scheduled post {post_id}")
+            return True
                 
         except Exception as e:
             logger.error(f"Error cancelling scheduled post {post_id}: {e}")
@@ -126,16 +146,48 @@ class PostScheduler:
     async def reschedule_post(self, post_id: int, new_scheduled_at: datetime) -> bool:
         """Перепланирование поста"""
         try:
-            # Отменяем старое задание
-            await self.cancel_scheduled_post(post_id)
+            # Переносим существующее задание одной операцией
+            self.scheduler.reschedule_job(
+                f"publish_post_{post_id}",
+                jobstore=PERSISTENT_JOBSTORE,
+                trigger='date',
+                run_date=new_scheduled_at
+            )
+            logger.info(f"Rescheduled post {post_id} to {new_scheduled_at}")
+            return True
             
-            # Создаем новое
+        except JobLookupError:
+            # Задания нет (уже выполнено или не создавалось) - создаем новое
             return await self.schedule_post(post_id, new_scheduled_at)
             
         except Exception as e:
             logger.error(f"Error rescheduling post {post_id}: {e}")
             return False
 
+    async def _bootstrap_schedule(self):
+        """Восстановление заданий публикации из БД при запуске"""
+        # Посты, время которых прошло, пока бот не работал, публикуем сразу
+        await self._check_scheduled_posts()
+
+        try:
+            async with get_session() as session:
+                uow = UnitOfWork(session)
+                pending_posts = await uow.admin_posts.get_by_status(
+                    PostStatus.SCHEDULED
+                )
+
+            now = datetime.now()
+            scheduled = 0
+            for post in pending_posts:
+                if post.scheduled_at and post.scheduled_at > now:
+                    await self.schedule_post(post.id, post.scheduled_at)
+                    scheduled += 1
+
+            logger.info(f"Restored {scheduled} scheduled posts")
+
+        except Exception as e:
+            logger.error(f"Error restoring scheduled posts: {e}")
+
     async def _check_scheduled_posts(self):
         """Периодическая проверка запланированных постов"""
         try:
@@ -147,16 +199,22 @@ class PostScheduler:
         except Exception as e:
             logger.error(f"Error in scheduled posts check: {e}")
 
-    async def _expire_posts(self):
-        """Периодическая очистка истекших постов"""
+    async def _housekeeping(self):
+        """Периодическое обслуживание: пропущенные и истекшие посты в одной сессии"""
         try:
             async with get_session() as session:
                 uow = UnitOfWork(session)
-                await uow.scheduler_service.expire_posts()
+                await uow.scheduler_service.check_scheduled_posts()
+                
+                now = time.monotonic()
+                if now >= self._next_expire_at:
+                    await uow.scheduler_service.expire_posts()
+                    self._next_expire_at = now + EXPIRE_INTERVAL_SECONDS
+                
                 await uow.commit()
                 
         except Exception as e:
-            logger.error(f"Error in posts expiration: {e}")
+            logger.error(f"Error in scheduler housekeeping: {e}")
 
     async def _publish_post(self, post_id: int):
         """Публикация конкретного поста"""
@@ -191,22 +249,28 @@ class PostScheduler:
                 'next_run_time': job.next_run_time,
                 'args': job.args
             }
-            for job in self.scheduler.get_jobs()
-            if job.id.startswith('publish_post_')
+            for job in self.scheduler.get_jobs(jobstore=PERSISTENT_JOBSTORE)
         ]
 
+    def _count_scheduled_jobs(self) -> int:
+        """Число заданий публикации в Redis (общее для всех процессов)"""
+        # ZCARD по индексу времени запуска, без чтения и распаковки заданий
+        jobstore = self._persistent_jobstore
+        return jobstore.redis.zcard(jobstore.run_times_key)
+
     async def get_scheduler_status(self) -> dict:
         """Получение статуса планировщика"""
         try:
             async with get_session() as session:
                 uow = UnitOfWork(session)
                 stats = await uow.scheduler_service.get_scheduler_stats()
-                
-                return {
-                    'running': self._running,
-                    'scheduled_jobs': len(self.get_scheduled_jobs()),
-                    **stats
-                }
+            
+            scheduled_jobs = await asyncio.to_thread(self._count_scheduled_jobs)
+            return {
+                'running': self._running,
+                'scheduled_jobs': scheduled_jobs,
+                **stats
+            }
                 
         except Exception as e:
             logger.error(f"Error getting scheduler status: {e}")
@@ -219,15 +283,19 @@ class PostScheduler:
 
 # Глобальный экземпляр планировщика
 post_scheduler: Optional[PostScheduler] = None
+# Вторые вызовы init_post_scheduler ждут, пока первый не закончит запуск
+_init_lock = asyncio.Lock()
 
 
 async def init_post_scheduler(redis_url: str = "redis://localhost:6379/1") -> PostScheduler:
     """Инициализация глобального планировщика постов"""
     global post_scheduler
     
-    if post_scheduler is None:
-        post_scheduler = PostScheduler(redis_url)
-        await post_scheduler.start()
+    async with _init_lock:
+        if post_scheduler is None:
+            scheduler = PostScheduler(redis_url)
+            await scheduler.start()
+            post_scheduler = scheduler
     
     return post_scheduler
 
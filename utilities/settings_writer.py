@@ -0,0 +1,130 @@
+# utilities/settings_writer.py
+
+import asyncio
+import contextlib
+import time
+
+from cache.captcha_settings_cache import captcha_settings_cache
+from database.models.captcha_setting import CaptchaSetting
+from loguru import logger
+from sqlalchemy import update
+
+
+class CaptchaSettingsWriter:
+    """Отложенная пакетная запись изменений настроек каптчи (write-behind)
+
+    Обработчики ставят изменения в очередь и сразу отвечают пользователю,
+    а фоновая задача накапливает до max_batch изменений или max_delay секунд
+    и применяет их одной транзакцией с одним COMMIT. Неудачная запись
+    повторяется до max_retries раз, после чего изменения отбрасываются,
+    а затронутые группы удаляются из кэша, чтобы он не расходился с БД.
+    """
+
+    def __init__(
+        self,
+        max_batch: int = 50,
+        max_delay: float = 0.1,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+    ):
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self._queue: asyncio.Queue[tuple[int, str, object]] = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+        self._db = None
+
+    async def start(self, db) -> None:
+        """Запуск фоновой задачи записи"""
+        if self._task is not None:
+            logger.warning("Captcha settings writer уже запущен")
+            return
+
+        self._db = db
+        self._task = asyncio.create_task(self._run())
+        logger.info("Captcha settings writer запущен")
+
+    async def stop(self) -> None:
+        """Остановка фоновой задачи с записью оставшихся изменений"""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+        # Дописываем все, что осталось в очереди
+        batch = []
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        if batch:
+            await self._flush_with_retry(batch, retry_delay=0)
+        logger.info("Captcha settings writer остановлен")
+
+    def enqueue(self, group_id: int, key: str, value) -> None:
+        """Поставить изменение настройки в очередь на запись"""
+        self._queue.put_nowait((group_id, key, value))
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            deadline = time.monotonic() + self.max_delay
+
+            while len(batch) < self.max_batch:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except TimeoutError:
+                    break
+
+            await self._flush_with_retry(batch, self.retry_delay)
+
+    async def _flush_with_retry(
+        self, batch: list[tuple[int, str, object]], retry_delay: float
+    ) -> None:
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                await self._flush(batch)
+                return
+            except Exception as e:
+                logger.opt(exception=e).error(
+                    f"Ошибка записи {len(batch)} изменений настроек каптчи "
+                    f"(попытка {attempt}/{self.max_retries})"
+                )
+            if attempt < self.max_retries and retry_delay:
+                await asyncio.sleep(retry_delay * attempt)
+
+        # Изменения не записаны: кэш больше не совпадает с БД,
+        # при следующем обращении настройки будут загружены заново
+        group_ids = {group_id for group_id, _, _ in batch}
+        for group_id in group_ids:
+            captcha_settings_cache.invalidate(group_id)
+        logger.error(
+            f"Отброшено {len(batch)} изменений настроек каптчи "
+            f"для групп {sorted(group_ids)}"
+        )
+
+    async def _flush(self, batch: list[tuple[int, str, object]]) -> None:
+        # Схлопываем изменения: для каждой группы и ключа важно последнее значение
+        changes: dict[int, dict[str, object]] = {}
+        for group_id, key, value in batch:
+            changes.setdefault(group_id, {})[key] = value
+
+        async with self._db.get_session() as session:
+            for group_id, values in changes.items():
+                await session.execute(
+                    update(CaptchaSetting)
+                    .where(CaptchaSetting.group_id == group_id)
+                    .values(**values)
+                )
+            await session.commit()
+
+        logger.debug(f"Записано {len(batch)} изменений для {len(changes)} групп")
+
+
+# Глобальный экземпляр отложенной записи настроек каптчи
+captcha_settings_writer = CaptchaSettingsWriter()